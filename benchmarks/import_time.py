@@ -0,0 +1,54 @@
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = {
+    'import pyacet': 'import pyacet',
+    'DataLoader': 'import pyacet; pyacet.DataLoader',
+    'DataSummary': 'import pyacet; pyacet.DataSummary',
+    'StreamingSummary': 'import pyacet; pyacet.StreamingSummary',
+    'ReportGenerator': 'import pyacet; pyacet.ReportGenerator',
+    'Visualization': 'import pyacet; pyacet.Visualization',
+    'PDF': 'import pyacet; pyacet.PDF'
+}
+
+HEAVY_MODULES = ['pandas', 'matplotlib', 'seaborn', 'fpdf', 'PIL', 'pkg_resources']
+
+def measure(statement, repeat):
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(elapsed, ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, os.environ.get('PYTHONPATH', '')]))
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', code], env=env, check=True,
+                                capture_output=True, text=True).stdout.split()
+        times.append(float(output[0]))
+    return statistics.median(times), output[1] if len(output) > 1 else ''
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure pyacet import time in fresh interpreters.')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=None, help="Fail if 'import pyacet' exceeds this many seconds.")
+    args = parser.parse_args()
+
+    print(f"{'target':<20}{'median (s)':>12}  loaded heavy modules")
+    results = {}
+    for name, statement in TARGETS.items():
+        results[name], loaded = measure(statement, args.repeat)
+        print(f"{name:<20}{results[name]:>12.3f}  {loaded or '-'}")
+
+    if args.budget is not None and results['import pyacet'] > args.budget:
+        print(f"'import pyacet' took {results['import pyacet']:.3f}s, over the {args.budget:.3f}s budget.")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TARGETS = ['summary', 'report', 'visualize']
+
+def split_columns(n_cols):
+    cat_cols = max(1, int(n_cols * 0.3))
+    dt_cols = max(1, int(n_cols * 0.1))
+    return max(1, n_cols - cat_cols - dt_cols), cat_cols, dt_cols
+
+def run_case(case):
+    sys.path.insert(0, ROOT)
+    import pyacet
+
+    num_cols, cat_cols, dt_cols = split_columns(case['cols'])
+    data = pyacet.generate_dataset(case['rows'], num_cols, cat_cols, dt_cols, cardinality=case['cardinality'],
+                                   null_rate=case['null_rate'], dup_rate=case['dup_rate'])
+    output_dir = tempfile.mkdtemp(prefix='pyacet_bench_')
+    start = time.perf_counter()
+    if case['target'] == 'summary':
+        summary = pyacet.DataSummary(data)
+        summary.data_info()
+        summary.data_numerical_summary()
+        summary.data_categorical_summary()
+        summary.data_datetime_summary()
+        summary.data_correlation()
+    elif case['target'] == 'report':
+        pyacet.ReportGenerator(data, None, output_dir, 'benchmark').generate_report(None)
+    elif case['target'] == 'visualize':
+        pyacet.Visualization(data, None, output_dir).visualize([])
+    wall_time = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {'wall_time': wall_time, 'peak_rss_mb': peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024}
+
+def case_name(case):
+    return f"{case['target']}-{case['rows']}x{case['cols']}"
+
+def measure(case, repeat, timeout):
+    results = []
+    for _ in range(repeat):
+        # Every run gets a fresh interpreter so peak memory and caches are not shared between cases.
+        completed = subprocess.run([sys.executable, os.path.abspath(__file__), '--case', json.dumps(case)],
+                                   capture_output=True, text=True, timeout=timeout)
+        if completed.returncode != 0:
+            return {'error': completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else 'failed'}
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    results.sort(key=lambda result: result['wall_time'])
+    return results[len(results) // 2]
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None or 'error' in result or 'error' in previous:
+            continue
+        ratio = result['wall_time'] / previous['wall_time'] if previous['wall_time'] else float('inf')
+        result['baseline_ratio'] = ratio
+        if ratio > 1 + tolerance:
+            regressions.append((name, ratio))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pyacet over synthetic datasets.')
+    parser.add_argument('--case', help=argparse.SUPPRESS)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--cols', type=int, nargs='+', default=[10, 100])
+    parser.add_argument('--targets', nargs='+', default=['summary', 'report'], choices=TARGETS)
+    parser.add_argument('--cardinality', type=int, default=20)
+    parser.add_argument('--null-rate', type=float, default=0.05)
+    parser.add_argument('--dup-rate', type=float, default=0.05)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--timeout', type=float, default=3600)
+    parser.add_argument('--max-cells', type=float, default=1e9, help='Skip cases with more rows x columns than this.')
+    parser.add_argument('--output', default=None, help='Write the results as JSON.')
+    parser.add_argument('--baseline', default=None, help='Compare against a results JSON written by --output.')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed slowdown ratio over the baseline.')
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(json.loads(args.case))))
+        return
+
+    results = {}
+    print(f"{'case':<28}{'wall (s)':>12}{'peak RSS (MB)':>16}")
+    for target in args.targets:
+        for rows in args.rows:
+            for cols in args.cols:
+                if rows * cols > args.max_cells:
+                    continue
+                case = {'target': target, 'rows': rows, 'cols': cols, 'cardinality': args.cardinality,
+                        'null_rate': args.null_rate, 'dup_rate': args.dup_rate}
+                try:
+                    result = measure(case, args.repeat, args.timeout)
+                except subprocess.TimeoutExpired:
+                    result = {'error': f'timeout after {args.timeout}s'}
+                results[case_name(case)] = dict(case, **result)
+                if 'error' in result:
+                    print(f"{case_name(case):<28}{'failed':>12}  {result['error']}")
+                else:
+                    print(f"{case_name(case):<28}{result['wall_time']:>12.3f}{result['peak_rss_mb']:>16.1f}")
+
+    if args.baseline is not None:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for name, ratio in regressions:
+            print(f"Regression : {name} is {ratio:.2f}x the baseline")
+    else:
+        regressions = []
+
+    if args.output is not None:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if regressions:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,42 @@
-from .data_loader import DataLoader
-from .data_summary import DataSummary
-from .graph_generator import GraphGenerator
-from .graph_settings import GraphSettings
-from .visualization import Visualization
-from .report_generator import ReportGenerator
-from .pdf import PDF
-from .utils import *
-from .resources import get_font_path
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    'DataLoader': 'data_loader', 'ProfiledDataset': 'data_loader',
+    'DataSummary': 'data_summary',
+    'StreamingSummary': 'streaming_summary',
+    'IncrementalSummary': 'incremental_summary',
+    'GraphGenerator': 'graph_generator',
+    'GraphSettings': 'graph_settings',
+    'Visualization': 'visualization',
+    'ReportGenerator': 'report_generator',
+    'PDF': 'pdf',
+    'BatchRunner': 'batch',
+    'ArtifactCache': 'artifact_cache', 'artifact_cache': 'artifact_cache',
+    'StageRecorder': 'instrumentation', 'stage_recorder': 'instrumentation',
+    'ensure_trailing_slash': 'utils', 'create_output_directory': 'utils',
+    'timer': 'utils', 'generate_testset': 'utils', 'generate_dataset': 'utils',
+    'get_font_path': 'resources'
+}
 
 __all__ = [
-    'DataLoader', 'DataSummary', 'GraphGenerator', 'GraphSettings', 'get_font_path'
-    'Visualization', 'ReportGenerator', 'PDF', 'ensure_trailing_slash', 'create_output_directory'
+    'DataLoader', 'ProfiledDataset', 'DataSummary', 'StreamingSummary', 'IncrementalSummary', 'GraphGenerator', 'GraphSettings', 'get_font_path',
+    'Visualization', 'ReportGenerator', 'PDF', 'BatchRunner', 'ArtifactCache', 'artifact_cache', 'StageRecorder', 'stage_recorder', 'ensure_trailing_slash', 'create_output_directory'
     ]
 
+def __getattr__(name):
+    # PEP 562: submodules (and matplotlib, seaborn, fpdf behind them) load on first attribute access.
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(f'.{_LAZY_ATTRIBUTES[name]}', __name__), name)
+    else:
+        try:
+            value = importlib.import_module(f'.{name}', __name__)
+        except ModuleNotFoundError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 __version__ = '0.1.1'
-__author__ = 'YeongIL Kim'
\ No newline at end of file
+__author__ = 'YeongIL Kim'
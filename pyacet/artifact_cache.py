@@ -0,0 +1,57 @@
+import io
+import threading
+
+from collections import OrderedDict
+
+class ArtifactCache:
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key, factory):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        value = factory()
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+artifact_cache = ArtifactCache()
+
+def heatmap_kwargs(corr_matrix):
+    return {'data': corr_matrix, 'annot': len(corr_matrix) <= 30, 'fmt': '.2f', 'cmap': 'coolwarm', 'cbar': True}
+
+HEATMAP_SIZE = (20, 20)
+
+def render_correlation_heatmap(corr_matrix, file_format='png', options=None):
+    import matplotlib
+    import seaborn as sns
+    from matplotlib import rcParams
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from pyacet.graph_settings import _register_font
+    from pyacet.resources import get_font_path
+
+    # A fixed style makes the bytes independent of the caller, so the report and the plot can share one render.
+    with matplotlib.rc_context():
+        matplotlib.rcdefaults()
+        rcParams['font.family'] = _register_font(get_font_path('NanumGothic.ttf'))
+        rcParams['axes.unicode_minus'] = False
+        fig = Figure(figsize=HEATMAP_SIZE)
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+        sns.heatmap(ax=ax, **heatmap_kwargs(corr_matrix))
+        ax.set_title('heatmap')
+        fig.tight_layout()
+        buf = io.BytesIO()
+        fig.savefig(buf, format=file_format, **(options or {}))
+    return buf.getvalue()
@@ -0,0 +1,200 @@
+import os
+import sys
+import json
+import time
+import argparse
+import traceback
+import multiprocessing
+
+from collections import deque
+from multiprocessing.connection import wait
+
+from pyacet.utils import ensure_trailing_slash, create_output_directory
+
+TASKS = ('report', 'visualize')
+UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3, 'TB': 1024 ** 4}
+
+def parse_size(size):
+    if size is None or isinstance(size, (int, float)):
+        return size
+    size = str(size).strip().upper()
+    for unit in sorted(UNITS, key=len, reverse=True):
+        if size.endswith(unit):
+            return int(float(size[:-len(unit)]) * UNITS[unit])
+    return int(float(size))
+
+def available_memory():
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (ValueError, OSError, AttributeError):
+        return None
+
+def load_manifest(manifest):
+    if isinstance(manifest, (list, tuple)):
+        return [dict(entry) for entry in manifest]
+    with open(manifest, encoding='utf-8') as f:
+        if manifest.endswith(('.jsonl', '.ndjson')):
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
+
+def _run_job(job, conn):
+    try:
+        from pyacet.data_loader import DataLoader
+
+        dataset = DataLoader(job['path'], job.get('cols'), job.get('dtypes'), job.get('optimize', False)).profile()
+        if 'report' in job['tasks']:
+            from pyacet.report_generator import ReportGenerator
+            ReportGenerator(dataset, None, job['output_dir'], job['dataset_name'],
+                            **job.get('report_options', {})).generate_report(job.get('exclude_cols'))
+        if 'visualize' in job['tasks']:
+            from pyacet.visualization import Visualization
+            Visualization(dataset, None, job['output_dir'],
+                          **job.get('visualization_options', {})).visualize(job.get('exclude_cols') or [])
+        conn.send({'status': 'ok', 'rows': len(dataset.data)})
+    except Exception as e:
+        conn.send({'status': 'failed', 'error': f"{type(e).__name__}: {e}", 'traceback': traceback.format_exc()})
+    finally:
+        conn.close()
+
+class BatchRunner:
+    def __init__(self, manifest, output_dir, workers=None, memory_budget=None, timeout=None,
+                 tasks=TASKS, memory_factor=3.0):
+        self.output_dir = ensure_trailing_slash(output_dir)
+        self.workers = workers or max(1, (os.cpu_count() or 1) - 1)
+        self.memory_budget = parse_size(memory_budget) or available_memory()
+        self.timeout = timeout
+        self.tasks = tuple(tasks)
+        self.memory_factor = memory_factor
+        self.jobs = [self._make_job(entry) for entry in load_manifest(manifest)]
+        self.results = []
+        self.elapsed = 0.0
+
+    def _make_job(self, entry):
+        if 'path' not in entry:
+            raise ValueError(f"Manifest entry has no 'path': {entry}")
+        job = dict(entry)
+        job.setdefault('dataset_name', os.path.splitext(os.path.basename(os.fspath(entry['path'])))[0])
+        job.setdefault('output_dir', os.path.join(self.output_dir, job['dataset_name']))
+        job.setdefault('tasks', self.tasks)
+        invalid = set(job['tasks']) - set(TASKS)
+        if invalid:
+            raise ValueError(f"Selected tasks({sorted(invalid)}) are invalid. Use 'report' or 'visualize'.")
+        job['memory'] = self._estimate_memory(job)
+        return job
+
+    def _estimate_memory(self, job):
+        if 'memory' in job:
+            return parse_size(job['memory'])
+        # The on-disk size times memory_factor approximates the loaded frame plus working copies.
+        try:
+            return int(os.path.getsize(job['path']) * self.memory_factor)
+        except (OSError, TypeError):
+            return 0
+
+    def _admissible(self, job, running):
+        if not running:
+            return True
+        if len(running) >= self.workers:
+            return False
+        if self.memory_budget is None:
+            return True
+        reserved = sum(entry['job']['memory'] for entry in running.values())
+        return reserved + job['memory'] <= self.memory_budget
+
+    def run(self):
+        context = multiprocessing.get_context('fork') if sys.platform.startswith('linux') else multiprocessing.get_context()
+        pending = deque(self.jobs)
+        running = {}
+        self.results = []
+        start = time.perf_counter()
+
+        while pending or running:
+            # Jobs are admitted in manifest order; a large job waits until enough memory is released.
+            while pending and self._admissible(pending[0], running):
+                job = pending.popleft()
+                create_output_directory(job['output_dir'])
+                receiver, sender = context.Pipe(duplex=False)
+                process = context.Process(target=_run_job, args=(job, sender), daemon=True)
+                process.start()
+                sender.close()
+                running[process.sentinel] = {'job': job, 'process': process, 'conn': receiver,
+                                             'start': time.perf_counter()}
+                print(f"Batch Job Started : {job['dataset_name']}")
+
+            ready = wait(list(running), timeout=self._next_timeout(running))
+            now = time.perf_counter()
+            for sentinel in list(running):
+                entry = running[sentinel]
+                if sentinel in ready:
+                    result = entry['conn'].recv() if entry['conn'].poll() else {
+                        'status': 'failed', 'error': f"worker exited with code {entry['process'].exitcode}"}
+                elif self.timeout is not None and now - entry['start'] > self.timeout:
+                    entry['process'].terminate()
+                    result = {'status': 'timeout', 'error': f"exceeded {self.timeout}s"}
+                else:
+                    continue
+                entry['process'].join()
+                entry['conn'].close()
+                del running[sentinel]
+                result.update({'dataset_name': entry['job']['dataset_name'], 'elapsed': now - entry['start']})
+                self.results.append(result)
+                print(f"Batch Job Finished : {result['dataset_name']} ({result['status']}, {result['elapsed']:.1f}s)")
+
+        self.elapsed = time.perf_counter() - start
+        self._write_summary()
+        return self.results
+
+    def _next_timeout(self, running):
+        if self.timeout is None:
+            return None
+        now = time.perf_counter()
+        return max(0.0, min(entry['start'] + self.timeout - now for entry in running.values()))
+
+    def summary(self):
+        succeeded = [result for result in self.results if result['status'] == 'ok']
+        return {'jobs': len(self.results),
+                'succeeded': len(succeeded),
+                'failed': sum(result['status'] == 'failed' for result in self.results),
+                'timed_out': sum(result['status'] == 'timeout' for result in self.results),
+                'elapsed': self.elapsed,
+                'datasets_per_minute': len(succeeded) / self.elapsed * 60 if self.elapsed else 0.0,
+                'rows_per_second': sum(result['rows'] for result in succeeded) / self.elapsed if self.elapsed else 0.0}
+
+    def _write_summary(self):
+        summary = self.summary()
+        create_output_directory(self.output_dir)
+        with open(os.path.join(self.output_dir, 'batch_summary.json'), 'w', encoding='utf-8') as f:
+            json.dump({'summary': summary, 'results': self.results}, f, indent=2, default=str)
+        print(f"Batch Summary : {summary['succeeded']}/{summary['jobs']} succeeded, {summary['failed']} failed, "
+              f"{summary['timed_out']} timed out in {summary['elapsed']:.1f}s "
+              f"({summary['datasets_per_minute']:.2f} datasets/min, {summary['rows_per_second']:.0f} rows/s)")
+        for result in self.results:
+            if result['status'] != 'ok':
+                print(f"Batch Failure : {result['dataset_name']} - {result['error']}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='pyacet-batch', description='Profile every dataset in a manifest.')
+    parser.add_argument('manifest', help='JSON list or JSON Lines file of {path, cols, exclude_cols, dataset_name}.')
+    parser.add_argument('--output-dir', default='pyacet_output')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--memory-budget', default=None, help='Total memory for concurrent jobs, e.g. 16GB.')
+    parser.add_argument('--memory-factor', type=float, default=3.0, help='In-memory size per byte on disk.')
+    parser.add_argument('--timeout', type=float, default=None, help='Seconds before a job is terminated.')
+    parser.add_argument('--tasks', nargs='+', default=list(TASKS), choices=TASKS)
+    args = parser.parse_args(argv)
+
+    runner = BatchRunner(args.manifest, args.output_dir, args.workers, args.memory_budget,
+                         args.timeout, args.tasks, args.memory_factor)
+    runner.run()
+    summary = runner.summary()
+    return 0 if summary['succeeded'] == summary['jobs'] else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,39 @@
+import numpy as np
+
+from pyacet.sketches import HyperLogLog, TopK
+
+class CategoricalProfiler:
+    def __init__(self, exact_threshold=10000, top_k=100, precision=14, chunksize=1000000):
+        self.exact_threshold = exact_threshold
+        self.top_k = top_k
+        self.precision = precision
+        self.chunksize = chunksize
+
+    def _chunks(self, series):
+        for start in range(0, len(series), self.chunksize):
+            chunk = series.iloc[start:start + self.chunksize]
+            yield chunk[chunk.notna()]
+
+    def profile(self, series):
+        hll = HyperLogLog(self.precision)
+        topk = TopK(max(self.exact_threshold, self.top_k))
+        count = 0
+        for chunk in self._chunks(series):
+            counts = chunk.value_counts()
+            counts = counts[counts > 0]
+            count += len(chunk)
+            hll.update(counts.index)
+            topk.update_counts(counts)
+
+        if topk.exact:
+            ranked = topk.most_common()
+            unique = len(ranked)
+        else:
+            ranked = topk.most_common(self.top_k)
+            unique = int(round(hll.estimate()))
+        return {'count': count,
+                'unique': unique,
+                'top': ranked.index[0] if len(ranked) else np.nan,
+                'freq': int(ranked.iloc[0]) if len(ranked) else np.nan,
+                'features': ranked.index.tolist(),
+                'approximate': not topk.exact}
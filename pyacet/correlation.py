@@ -0,0 +1,192 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from concurrent.futures import ThreadPoolExecutor
+
+def top_correlated_pairs(corr_matrix, k=10):
+    values = corr_matrix.to_numpy()
+    rows, cols = np.triu_indices(len(values), k=1)
+    pairs = values[rows, cols]
+    valid = ~np.isnan(pairs)
+    rows, cols, pairs = rows[valid], cols[valid], pairs[valid]
+    k = min(k, len(pairs))
+    if k == 0:
+        return pd.DataFrame(columns=['column_1', 'column_2', 'correlation'])
+    top = np.argpartition(-np.abs(pairs), k - 1)[:k]
+    top = top[np.argsort(-np.abs(pairs[top]), kind='mergesort')]
+    return pd.DataFrame({'column_1': corr_matrix.index[rows[top]],
+                         'column_2': corr_matrix.columns[cols[top]],
+                         'correlation': pairs[top]})
+
+class CorrelationEngine:
+    # Working memory for one block pair of the pairwise Spearman re-ranking.
+    RERANK_BYTES = 128 * 1024 ** 2
+
+    def __init__(self, data, dtype='float32', block_size=None, workers=None, kendall_sample=None, random_state=42,
+                 spearman_pairwise=True):
+        self.data = data
+        self.columns = data.columns
+        self.dtype = dtype
+        self.block_size = block_size
+        self.workers = workers
+        self.kendall_sample = kendall_sample
+        self.random_state = random_state
+        self.spearman_pairwise = spearman_pairwise
+
+    def compute(self, method='pearson'):
+        if method == 'pearson':
+            corr = self._correlate(self.data.to_numpy(dtype='float64', na_value=np.nan))
+        elif method == 'spearman':
+            corr = self.spearman()
+        elif method == 'kendall':
+            return self.kendall()
+        else:
+            raise ValueError(f"Selected method({method}) is invalid. Use 'pearson' or 'spearman' or 'kendall'.")
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+    def spearman(self):
+        values = self.data.to_numpy(dtype='float64', na_value=np.nan)
+        corr = self._correlate(self.data.rank(method='average').to_numpy(dtype='float64', na_value=np.nan))
+        mask = ~np.isnan(values)
+        # Column ranks equal the pairwise ranks only when both columns miss the same rows; re-rank the other pairs.
+        patterns = pd.factorize(pd.Series([mask[:, i].tobytes() for i in range(mask.shape[1])]))[0]
+        n_patterns = patterns.max() + 1 if len(patterns) else 0
+        # spearman_pairwise=False keeps the column ranks for very wide frames; pairs with different nulls
+        # are then ranked over each column's own rows instead of their shared rows.
+        if n_patterns < 2 or not self.spearman_pairwise:
+            return corr
+        sizes = np.bincount(patterns)
+        cross_pairs = (len(patterns) ** 2 - (sizes ** 2).sum()) // 2
+        if (n_patterns - 1) * len(patterns) <= cross_pairs:
+            self._rerank_groups(values, mask, patterns, corr)
+        else:
+            self._rerank_pairs(values, mask, patterns, corr)
+        return corr
+
+    def _rerank_groups(self, values, mask, patterns, corr):
+        # All pairs between two null patterns share the same rows, so both groups are ranked once on them.
+        groups = [np.flatnonzero(patterns == code) for code in range(patterns.max() + 1)]
+        for a, left in enumerate(groups):
+            for right in groups[a + 1:]:
+                rows = mask[:, left[0]] & mask[:, right[0]]
+                cols = np.concatenate([left, right])
+                ranks = pd.DataFrame(values[np.ix_(rows, cols)]).rank(method='average').to_numpy()
+                block = self._correlate(ranks) if len(ranks) >= 2 else np.full((len(cols), len(cols)), np.nan)
+                corr[np.ix_(left, right)] = block[:len(left), len(left):]
+                corr[np.ix_(right, left)] = block[len(left):, :len(left)]
+
+    def _rerank_pairs(self, values, mask, patterns, corr):
+        # Every column is sorted once (NaN last). The average rank of a value within any row subset is then
+        # (count before its tie group) + (count inside the tie group + 1) / 2, both read from a cumulative sum
+        # of the subset's mask in that column's sort order. Columns are taken in blocks so one cumulative sum
+        # re-ranks a column against a whole block; doubled ranks stay integral, so the sums are exact.
+        n_rows, n_cols = values.shape
+        order = np.argsort(values, axis=0, kind='stable').T.copy()
+        ordered = np.take_along_axis(values.T, order, axis=1)
+        positions = np.arange(n_rows)
+        changed = np.ones((n_cols, n_rows + 1), dtype=bool)
+        changed[:, 1:-1] = ordered[:, 1:] != ordered[:, :-1]
+        # Tie group bounds of every row's value, indexed by row rather than by sorted position.
+        group_start = np.empty((n_cols, n_rows), dtype=np.intp)
+        group_end = np.empty((n_cols, n_rows), dtype=np.intp)
+        np.put_along_axis(group_start, order, np.maximum.accumulate(np.where(changed[:, :-1], positions, 0), axis=1), axis=1)
+        np.put_along_axis(group_end, order, np.minimum.accumulate(np.where(changed[:, 1:], positions, n_rows)[:, ::-1], axis=1)[:, ::-1] + 1, axis=1)
+        tied = (group_end - group_start > 1).any(axis=1)
+        del ordered, changed
+        mask = np.ascontiguousarray(mask.T)
+
+        def doubled_ranks(i, block_mask):
+            # Twice the rank of column i within the rows it shares with each column of the block, zero elsewhere.
+            counts = np.zeros((len(block_mask), n_rows + 1), dtype='int32')
+            np.cumsum(np.take(block_mask, order[i], axis=1), axis=1, out=counts[:, 1:])
+            shared = block_mask & mask[i]
+            before = np.take(counts, group_start[i], axis=1)
+            if tied[i]:
+                ranks = before + np.take(counts, group_end[i], axis=1) + 1
+            else:
+                # Without ties a row is its own group, so the count after it is the count before plus itself.
+                ranks = 2 * before + shared + 1
+            return (ranks * shared).astype('float64')
+
+        block = max(1, int(np.sqrt(self.RERANK_BYTES / (16 * max(n_rows, 1)))))
+        blocks = [np.arange(start, min(start + block, n_cols)) for start in range(0, n_cols, block)]
+        for a, rows in enumerate(blocks):
+            for cols in blocks[a:]:
+                pending = (patterns[rows][:, None] != patterns[cols][None, :]) & (rows[:, None] < cols[None, :])
+                if not pending.any():
+                    continue
+                left = np.stack([doubled_ranks(i, mask[cols]) for i in rows])
+                right = np.stack([doubled_ranks(j, mask[rows]) for j in cols])
+                # With doubled ranks A, B over m shared rows, sum((A - (m + 1)) * (B - (m + 1))) = sum(A * B) - m * (m + 1) ** 2.
+                count = (mask[rows].astype('float64') @ mask[cols].T.astype('float64'))
+                shift = count * (count + 1) ** 2
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    pair = (np.einsum('ijn,jin->ij', left, right) - shift) / np.sqrt(
+                        ((left ** 2).sum(axis=2) - shift) * ((right ** 2).sum(axis=2).T - shift))
+                pair = np.where(count >= 2, np.clip(pair, -1, 1), np.nan)
+                i, j = np.nonzero(pending)
+                corr[rows[i], cols[j]] = corr[cols[j], rows[i]] = pair[i, j]
+
+    def kendall(self):
+        data = self.data
+        if self.kendall_sample is not None and len(data) > self.kendall_sample:
+            print(f"Kendall correlation is approximate : estimated on {self.kendall_sample} of {len(data)} rows.")
+            data = data.sample(n=self.kendall_sample, random_state=self.random_state)
+        return data.corr(method='kendall')
+
+    def top_pairs(self, k=10, method='pearson'):
+        return top_correlated_pairs(self.compute(method), k)
+
+    def _correlate(self, values):
+        # Center and scale in float64 first; only the standardized block is cast to self.dtype, so
+        # columns with a large offset keep their variance.
+        mask = ~np.isnan(values)
+        if mask.all():
+            values = values - values.mean(axis=0)
+            norms = np.sqrt((values ** 2).sum(axis=0))
+            with np.errstate(invalid='ignore', divide='ignore'):
+                values = np.asfortranarray((values / norms).astype(self.dtype))
+            corr = self._gram(values, values, symmetric=True).astype('float64')
+        else:
+            # Pairwise-complete statistics from four masked gram matrices.
+            with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                scale = np.nanstd(values, axis=0)
+                values = (values - np.nanmean(values, axis=0)) / np.where(scale > 0, scale, 1)
+                values = np.where(mask, values, 0).astype(self.dtype)
+            weights = np.asfortranarray(mask.astype(self.dtype))
+            values = np.asfortranarray(values)
+            n = self._gram(weights, weights, symmetric=True).astype('float64')
+            sx = self._gram(values, weights).astype('float64')
+            sxx = self._gram(values ** 2, weights).astype('float64')
+            sxy = self._gram(values, values, symmetric=True).astype('float64')
+            with np.errstate(invalid='ignore', divide='ignore'):
+                var = n * sxx - sx ** 2
+                corr = (n * sxy - sx * sx.T) / np.sqrt(var * var.T)
+        corr = np.clip(corr, -1, 1)
+        np.fill_diagonal(corr, np.where(np.isnan(np.diag(corr)), np.nan, 1.0))
+        return corr
+
+    def _gram(self, left, right, symmetric=False):
+        n_cols = left.shape[1]
+        if self.block_size is None or self.block_size >= n_cols:
+            return left.T @ right
+        out = np.empty((n_cols, right.shape[1]), dtype=np.result_type(left, right))
+        blocks = [slice(start, min(start + self.block_size, n_cols)) for start in range(0, n_cols, self.block_size)]
+        tiles = [(i, j) for i in range(len(blocks)) for j in range(len(blocks)) if not symmetric or i <= j]
+
+        def fill(tile):
+            i, j = tile
+            out[blocks[i], blocks[j]] = left[:, blocks[i]].T @ right[:, blocks[j]]
+            if symmetric and i != j:
+                out[blocks[j], blocks[i]] = out[blocks[i], blocks[j]].T
+
+        if self.workers is not None and self.workers > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                list(executor.map(fill, tiles))
+        else:
+            for tile in tiles:
+                fill(tile)
+        return out
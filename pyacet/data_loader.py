@@ -1,13 +1,188 @@
+import os
+import hashlib
+import warnings
+import threading
+
 import numpy as np
 import pandas as pd
 
+from pyacet.instrumentation import stage
+from pyacet.numeric_profiler import NumericProfiler
+
+class ProfiledDataset:
+    def __init__(self, data, num_cols, cat_cols, dt_cols):
+        self.data = data
+        self.num_cols = num_cols
+        self.cat_cols = cat_cols
+        self.dt_cols = dt_cols
+        self._row_hashes = None
+        self._fingerprint = None
+        self._numeric_profiles = {}
+        self._lock = threading.RLock()
+        self._profile_lock = threading.Lock()
+
+    def row_hashes(self):
+        # Report sections run on threads and several of them need the hashes; compute them once.
+        with self._lock:
+            if self._row_hashes is None:
+                self._row_hashes = pd.util.hash_pandas_object(self.data, index=False).to_numpy()
+        return self._row_hashes
+
+    def fingerprint(self):
+        with self._lock:
+            if self._fingerprint is None:
+                digest = hashlib.sha1(self.row_hashes().tobytes())
+                digest.update(repr(list(self.data.columns)).encode())
+                digest.update(repr(self.data.dtypes.astype(str).tolist()).encode())
+                self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def numeric_profile(self, quantile_mode='exact', bins=15):
+        if self.num_cols is None:
+            return None
+        # Nulls, describe, correlation and histograms all read this profile; compute it once per setting.
+        with self._profile_lock:
+            key = (quantile_mode, bins)
+            if key not in self._numeric_profiles:
+                with stage('numeric_profile', self.data[self.num_cols]):
+                    profiler = NumericProfiler(quantile_mode, bins)
+                    self._numeric_profiles[key] = profiler.profile(self.data[self.num_cols])
+            return self._numeric_profiles[key]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock'], state['_profile_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+        self._profile_lock = threading.Lock()
+
+FILE_FORMATS = {
+    '.csv': 'csv', '.tsv': 'csv',
+    '.jsonl': 'jsonl', '.ndjson': 'jsonl',
+    '.json': 'json',
+    '.parquet': 'parquet', '.pq': 'parquet',
+    '.feather': 'feather', '.arrow': 'feather', '.ipc': 'feather'
+}
+
+COMPRESSIONS = ('.gz', '.bz2', '.zip', '.xz', '.zst')
+
+def _is_datetime_text(values):
+    values = values.dropna()
+    if values.empty or values.dtype != object or not values.map(type).eq(str).all():
+        return False
+    if pd.to_numeric(values, errors='coerce').notna().any():
+        return False
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)
+        return pd.to_datetime(values, errors='coerce').notna().all()
+
 class DataLoader:
-    def __init__(self, input, cols):
-        self.input = input
+    def __init__(self, input, cols=None, dtypes=None, optimize=False, category_ratio=0.5):
+        self.input = os.fspath(input) if isinstance(input, os.PathLike) else input
         self.cols = cols
+        self.dtypes = dtypes
+        self.optimize = optimize
+        self.category_ratio = category_ratio
+        self.memory_usage = None
+        self._data = None
+
+    def _file_format(self):
+        if not isinstance(self.input, str) or '\n' in self.input:
+            return None
+        path = self.input.lower()
+        if path.endswith(COMPRESSIONS):
+            path = os.path.splitext(path)[0]
+        return FILE_FORMATS.get(os.path.splitext(path)[1])
+
+    def _project(self, df, convert=True):
+        if self.cols is not None:
+            df = df[list(self.cols)]
+        if convert and self.dtypes is not None:
+            df = df.astype({col: dtype for col, dtype in self.dtypes.items() if col in df.columns})
+        return df
+
+    def _csv_options(self):
+        sep = '\t' if '.tsv' in self.input.lower() else ','
+        usecols = list(self.cols) if self.cols is not None else None
+        dtypes = dict(self.dtypes or {})
+        # read_csv rejects datetime dtypes; those columns go through parse_dates instead.
+        parse_dates = [col for col, dtype in dtypes.items() if pd.api.types.is_datetime64_any_dtype(pd.api.types.pandas_dtype(dtype))]
+        for col in parse_dates:
+            del dtypes[col]
+        # Text columns that all parse as dates are read as datetimes, like the other formats' typed columns.
+        sample = pd.read_csv(self.input, sep=sep, usecols=usecols, dtype=dtypes or None, nrows=1000)
+        parse_dates += [col for col in sample.columns
+                        if col not in parse_dates and col not in dtypes and _is_datetime_text(sample[col])]
+        return {'sep': sep, 'usecols': usecols, 'dtype': dtypes or None, 'parse_dates': parse_dates or None}
+
+    def _read_file(self, file_format):
+        usecols = list(self.cols) if self.cols is not None else None
+        if file_format == 'csv':
+            return self._project(pd.read_csv(self.input, **self._csv_options()), convert=False)
+        elif file_format == 'jsonl':
+            with pd.read_json(self.input, lines=True, dtype=self.dtypes, chunksize=100000) as reader:
+                return pd.concat([self._project(chunk) for chunk in reader], ignore_index=True)
+        elif file_format == 'json':
+            return self._project(pd.read_json(self.input, dtype=self.dtypes))
+        elif file_format == 'parquet':
+            return self._project(pd.read_parquet(self.input, columns=usecols, memory_map=True))
+        elif file_format == 'feather':
+            import pyarrow.feather as feather
+            return self._project(feather.read_table(self.input, columns=usecols, memory_map=True).to_pandas())
 
     def load_data(self):
-        if isinstance(self.input, pd.DataFrame):
+        if self._data is None:
+            with stage('load') as record:
+                self._data = self._read_input()
+                if self.optimize and not isinstance(self.input, ProfiledDataset):
+                    self._data = self.optimize_memory(self._data)
+                record['rows'], record['cols'] = self._data.shape
+        return self._data
+
+    def optimize_memory(self, df):
+        before = df.memory_usage(deep=True).sum()
+        columns = {}
+        for col in df.columns:
+            series = df[col]
+            if pd.api.types.is_integer_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                series = pd.to_numeric(series, downcast='integer')
+            elif pd.api.types.is_float_dtype(series):
+                series = pd.to_numeric(series, downcast='float')
+            elif series.dtype == object:
+                series = self._optimize_object(series)
+            columns[col] = series
+        df = pd.DataFrame(columns, index=df.index)
+        after = df.memory_usage(deep=True).sum()
+        self.memory_usage = (before, after)
+        print(f"Memory usage : {before / 1024 ** 2:.2f} MB -> {after / 1024 ** 2:.2f} MB "
+              f"({(1 - after / before) * 100 if before else 0:.1f}% reduction)")
+        return df
+
+    def _optimize_object(self, series):
+        values = series.dropna()
+        if values.empty:
+            return series
+        if _is_datetime_text(values.iloc[:1000]):
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', UserWarning)
+                parsed = pd.to_datetime(series, errors='coerce')
+            if parsed.notna().sum() == len(values):
+                return parsed
+        try:
+            n_unique = values.nunique()
+        except TypeError:
+            return series
+        if n_unique <= self.category_ratio * len(series):
+            return series.astype('category')
+        return series
+
+    def _read_input(self):
+        if isinstance(self.input, ProfiledDataset):
+            return self.input.data
+        elif isinstance(self.input, pd.DataFrame):
             return self.input
         elif isinstance(self.input, dict):
             return pd.DataFrame.from_dict(self.input, orient='columns')
@@ -17,11 +192,39 @@ class DataLoader:
             return pd.DataFrame(self.input, columns=self.cols)
         elif isinstance(self.input, np.ndarray):
             return pd.DataFrame(self.input, columns=self.cols)
+        elif isinstance(self.input, str) and self._file_format() is not None:
+            return self._read_file(self._file_format())
         elif isinstance(self.input, str):
             return pd.read_json(self.input)
         else:
             raise TypeError('Input Data Must Be a Pandas DataFrame, Dict, List or Numpy Array.')
-        
+
+    def iter_chunks(self, chunksize):
+        file_format = self._file_format()
+        usecols = list(self.cols) if self.cols is not None else None
+        if file_format == 'csv':
+            with pd.read_csv(self.input, chunksize=chunksize, **self._csv_options()) as reader:
+                for chunk in reader:
+                    yield self._project(chunk, convert=False)
+        elif file_format == 'jsonl':
+            with pd.read_json(self.input, lines=True, dtype=self.dtypes, chunksize=chunksize) as reader:
+                for chunk in reader:
+                    yield self._project(chunk)
+        elif file_format == 'parquet':
+            import pyarrow.parquet as pq
+            parquet_file = pq.ParquetFile(self.input, memory_map=True)
+            for batch in parquet_file.iter_batches(batch_size=chunksize, columns=usecols):
+                yield self._project(batch.to_pandas())
+        elif file_format == 'feather':
+            import pyarrow.feather as feather
+            table = feather.read_table(self.input, columns=usecols, memory_map=True)
+            for batch in table.to_batches(max_chunksize=chunksize):
+                yield self._project(batch.to_pandas())
+        else:
+            input = self.load_data()
+            for start in range(0, len(input), chunksize):
+                yield input.iloc[start:start + chunksize]
+
     def get_numerical_cols(self):
         input = self.load_data()
         num_cols = input.select_dtypes(include=[np.number]).columns
@@ -30,16 +233,16 @@ class DataLoader:
         else:
             print('There are no numerical columns in the dataset.')
             return None
-    
+
     def get_categorical_cols(self):
         input = self.load_data()
-        cat_cols = input.select_dtypes(include=['object']).columns
+        cat_cols = input.select_dtypes(include=['object', 'category']).columns
         if not cat_cols.empty:
             return cat_cols
         else:
             print('There are no categorical columns in the dataset.')
             return None
-    
+
     def get_datetime_cols(self):
         input = self.load_data()
         dt_cols = input.select_dtypes(include=['datetime']).columns
@@ -47,4 +250,12 @@ class DataLoader:
             return dt_cols
         else:
             print('There are no datetime columns in the dataset.')
-            return None
\ No newline at end of file
+            return None
+
+    def profile(self):
+        if isinstance(self.input, ProfiledDataset):
+            return self.input
+        return ProfiledDataset(self.load_data(),
+                               self.get_numerical_cols(),
+                               self.get_categorical_cols(),
+                               self.get_datetime_cols())
@@ -1,15 +1,31 @@
 import io
 import datetime as dt
 
+import pandas as pd
+
+from pyacet.artifact_cache import artifact_cache, render_correlation_heatmap
+from pyacet.categorical_profiler import CategoricalProfiler
+from pyacet.correlation import CorrelationEngine, top_correlated_pairs
 from pyacet.data_loader import DataLoader
+from pyacet.duplicates import DuplicateDetector
+from pyacet.instrumentation import instrument
 
 class DataSummary:
-    def __init__(self, input, cols):
-        self.input = DataLoader(input, cols).load_data()
-        self.num_cols = DataLoader(input, cols).get_numerical_cols()
-        self.cat_cols = DataLoader(input, cols).get_categorical_cols()
-        self.dt_cols = DataLoader(input, cols).get_datetime_cols()
+    def __init__(self, input, cols=None, sketch_categories=False, duplicate_subset=None, duplicate_mode='exact',
+                 quantile_mode='exact', kendall_sample=None):
+        self.sketch_categories = sketch_categories
+        self.quantile_mode = quantile_mode
+        self.kendall_sample = kendall_sample
+        self.duplicate_subset = duplicate_subset
+        self.duplicate_mode = duplicate_mode
+        self.duplicate_error = 0
+        self.dataset = DataLoader(input, cols).profile()
+        self.input = self.dataset.data
+        self.num_cols = self.dataset.num_cols
+        self.cat_cols = self.dataset.cat_cols
+        self.dt_cols = self.dataset.dt_cols
         
+    @instrument()
     def data_info(self):
         buffer = io.StringIO()
         self.input.info(buf=buffer)
@@ -17,21 +33,44 @@ class DataSummary:
         data_info = buffer.getvalue()
         data_shape = self.input.shape
         data_head = self.input.head()
-        data_null = self.input.isnull().sum()
-        data_duplication = self.input.duplicated().sum()
+        data_null = self._count_nulls()
+        data_duplication = self._count_duplicates()
         
         return data_info, data_shape, data_head, data_null, data_duplication
     
+    def _numeric_profile(self):
+        return self.dataset.numeric_profile(self.quantile_mode)
+
+    def _count_nulls(self):
+        profile = self._numeric_profile()
+        if profile is None or not self.input.columns.is_unique:
+            return self.input.isnull().sum()
+        other_cols = self.input.columns.difference(profile.columns, sort=False)
+        return pd.concat([profile.nulls, self.input[other_cols].isnull().sum()]).reindex(self.input.columns)
+
+    def _count_duplicates(self):
+        detector = DuplicateDetector(self.duplicate_subset, self.duplicate_mode, capacity=max(len(self.input), 1))
+        if self.duplicate_subset is None:
+            detector.update_hashes(self.dataset.row_hashes())
+        else:
+            detector.update(self.input)
+        self.duplicate_error = detector.error_bound
+        return detector.duplicates
+
+    @instrument()
     def data_numerical_summary(self):
         if self.num_cols is not None and len(self.num_cols) > 0:
-            num_cols_summary = round(self.input[self.num_cols].describe(), 2)
+            num_cols_summary = round(self._numeric_profile().describe(), 2)
             return num_cols_summary
         else:
             pass
     
+    @instrument()
     def data_categorical_summary(self, exclude_cols=None):
-        if self.cat_cols is not None and len(self.cat_cols) > 0:
-            cat_cols_summary = self.input[self.cat_cols].describe(include='O')
+        if self.cat_cols is not None and len(self.cat_cols) > 0 and self.sketch_categories:
+            return self._sketch_categorical_summary(exclude_cols)
+        elif self.cat_cols is not None and len(self.cat_cols) > 0:
+            cat_cols_summary = self.input[self.cat_cols].describe(include=['object', 'category'])
             features_dict = {}
             if exclude_cols is not None:
                 for col in [cols for cols in self.cat_cols if cols not in exclude_cols]:
@@ -47,6 +86,21 @@ class DataSummary:
         else:
             pass
     
+    def _sketch_categorical_summary(self, exclude_cols=None):
+        profiler = CategoricalProfiler()
+        summary = {}
+        features_dict = {}
+        for col in self.cat_cols:
+            profile = profiler.profile(self.input[col])
+            summary[col] = {key: profile[key] for key in ['count', 'unique', 'top', 'freq']}
+            if exclude_cols is None or col not in exclude_cols:
+                features_dict[col] = {'features': profile['features'],
+                                      'num_features': profile['unique'],
+                                      'approximate': profile['approximate']}
+        cat_cols_summary = pd.DataFrame(summary, index=['count', 'unique', 'top', 'freq'], dtype='object')
+        return cat_cols_summary, features_dict
+
+    @instrument()
     def data_datetime_summary(self):
         if self.dt_cols is not None and len(self.dt_cols) > 0:
             dt_cols_summary = {
@@ -63,9 +117,40 @@ class DataSummary:
         else:
             pass
 
+    @instrument()
     def data_correlation(self, methods='pearson'):
         if self.num_cols is not None and len(self.num_cols) > 0:
-            corr_matrix = round(self.input[self.num_cols].corr(method=methods), 2)
+            key = ('correlation', self.dataset.fingerprint(), methods, self.kendall_sample if methods == 'kendall' else None)
+            corr_matrix = artifact_cache.get_or_create(key, lambda: round(self._compute_correlation(methods), 2))
             return corr_matrix
+        else:
+            pass
+
+    def _compute_correlation(self, methods):
+        if methods == 'pearson':
+            return self._numeric_profile().correlation()
+        return CorrelationEngine(self.input[self.num_cols], kendall_sample=self.kendall_sample).compute(methods)
+
+    @instrument()
+    def data_histograms(self):
+        if self.num_cols is not None and len(self.num_cols) > 0:
+            return self._numeric_profile().histograms
+        else:
+            pass
+
+    @instrument()
+    def data_correlation_pairs(self, k=10, methods='pearson'):
+        corr_matrix = self.data_correlation(methods)
+        if corr_matrix is not None and len(corr_matrix) > 1:
+            return top_correlated_pairs(corr_matrix, k)
+        else:
+            pass
+
+    @instrument()
+    def correlation_heatmap(self, methods='pearson', file_format='png', options=None):
+        corr_matrix = self.data_correlation(methods)
+        if corr_matrix is not None:
+            key = ('correlation_heatmap', self.dataset.fingerprint(), methods, file_format, repr(sorted((options or {}).items())))
+            return artifact_cache.get_or_create(key, lambda: render_correlation_heatmap(corr_matrix, file_format, options))
         else:
             pass
\ No newline at end of file
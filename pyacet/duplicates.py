@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+
+from pyacet.sketches import HyperLogLog
+
+class DuplicateDetector:
+    def __init__(self, subset=None, mode='exact', capacity=10000000, error_rate=0.01, precision=14):
+        if mode not in ('exact', 'bloom', 'hll'):
+            raise ValueError(f"Selected mode({mode}) is invalid. Use 'exact' or 'bloom' or 'hll'.")
+        self.subset = subset
+        self.mode = mode
+        self.n_rows = 0
+        self._duplicates = 0
+        if mode == 'exact':
+            self.hashes = np.empty(0, dtype='uint64')
+            self._pending = []
+        elif mode == 'bloom':
+            n_bits = int(np.ceil(-capacity * np.log(error_rate) / np.log(2) ** 2 / 8)) * 8
+            self.n_hashes = max(1, int(round(n_bits / capacity * np.log(2))))
+            self.bits = np.zeros(n_bits // 8, dtype='uint8')
+        else:
+            self.hll = HyperLogLog(precision)
+
+    def hash_rows(self, data):
+        if self.subset is not None:
+            data = data[list(self.subset)]
+        return pd.util.hash_pandas_object(data, index=False).to_numpy()
+
+    def update(self, data):
+        self.update_hashes(self.hash_rows(data))
+
+    def update_hashes(self, hashes):
+        hashes = np.asarray(hashes, dtype='uint64')
+        self.n_rows += len(hashes)
+        if self.mode == 'hll':
+            self.hll.update_hashes(hashes)
+            return
+        uniques = pd.unique(hashes)
+        if self.mode == 'exact':
+            self._pending.append(uniques)
+            if sum(len(h) for h in self._pending) >= max(len(self.hashes), 1 << 20):
+                self._consolidate()
+        else:
+            self._duplicates += len(hashes) - len(uniques)
+            byte, bit = self._bloom_positions(uniques)
+            self._duplicates += int(((self.bits[byte] >> bit) & 1).all(axis=1).sum())
+            byte, bit = byte.ravel(), bit.ravel()
+            for offset in range(8):
+                # Repeated bytes within one offset write the same value, so plain fancy assignment is safe.
+                self.bits[byte[bit == offset]] |= np.uint8(1 << offset)
+
+    def _bloom_positions(self, hashes):
+        # Double hashing: the two 32-bit halves of the row hash derive all k probe positions.
+        low = hashes & np.uint64(0xFFFFFFFF)
+        high = (hashes >> np.uint64(32)) | np.uint64(1)
+        probes = np.arange(self.n_hashes, dtype='uint64')
+        positions = (low[:, None] + probes[None, :] * high[:, None]) % np.uint64(len(self.bits) * 8)
+        return (positions >> np.uint64(3)).astype(np.intp), (positions & np.uint64(7)).astype('uint8')
+
+    def _consolidate(self):
+        if self._pending:
+            self.hashes = pd.unique(np.concatenate([self.hashes] + self._pending))
+            self._pending = []
+
+    def _bloom_cardinality(self, bits):
+        n_bits = len(bits) * 8
+        filled = int(np.unpackbits(bits).sum())
+        if filled >= n_bits:
+            return float('inf')
+        return -n_bits / self.n_hashes * np.log(1 - filled / n_bits)
+
+    def merge(self, other):
+        if self.mode != other.mode:
+            raise ValueError(f"Cannot merge a {other.mode} detector into a {self.mode} detector.")
+        if self.mode == 'exact':
+            other._consolidate()
+            self._pending.append(other.hashes)
+            self._consolidate()
+        elif self.mode == 'bloom':
+            distinct = (self.n_rows - self._duplicates) + (other.n_rows - other._duplicates)
+            merged = self.bits | other.bits
+            overlap = max(0, int(round(distinct - self._bloom_cardinality(merged))))
+            self._duplicates += other._duplicates + overlap
+            self.bits = merged
+        else:
+            self.hll.merge(other.hll)
+        self.n_rows += other.n_rows
+
+    def __getstate__(self):
+        if self.mode == 'exact':
+            self._consolidate()
+        return self.__dict__
+
+    @property
+    def approximate(self):
+        return self.mode != 'exact'
+
+    @property
+    def duplicates(self):
+        if self.mode == 'exact':
+            self._consolidate()
+            return self.n_rows - len(self.hashes)
+        elif self.mode == 'bloom':
+            return self._duplicates
+        return max(0, self.n_rows - int(round(self.hll.estimate())))
+
+    @property
+    def error_bound(self):
+        if self.mode == 'exact':
+            return 0
+        elif self.mode == 'bloom':
+            # Bloom false positives only overcount: expected excess is the fill-rate probability per distinct row.
+            false_positive = (np.unpackbits(self.bits).mean()) ** self.n_hashes
+            return int(np.ceil(false_positive * (self.n_rows - self._duplicates)))
+        return int(np.ceil(self.hll.relative_error * self.hll.estimate()))
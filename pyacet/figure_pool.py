@@ -0,0 +1,79 @@
+import threading
+
+from collections import OrderedDict
+from matplotlib import rcParams
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+SUBPLOT_PARAMS = ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')
+
+class FigurePool:
+    def __init__(self, max_figures=8):
+        self.max_figures = max_figures
+        self._free = OrderedDict()
+        self._owned = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, nrows, ncols, figsize):
+        key = (nrows, ncols, tuple(figsize))
+        with self._lock:
+            if self._free.get(key):
+                fig = self._free[key].pop()
+                if not self._free[key]:
+                    del self._free[key]
+                return fig, self._owned[fig][1]
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(nrows, ncols, squeeze=False).flatten()
+        with self._lock:
+            self._owned[fig] = (key, axes)
+        return fig, axes
+
+    def release(self, fig):
+        with self._lock:
+            owned = self._owned.get(fig)
+        if owned is None:
+            return
+        key, axes = owned
+        if self.max_figures <= 0:
+            self._discard(fig)
+            return
+        self._reset(fig, axes)
+        with self._lock:
+            self._free.setdefault(key, []).append(fig)
+            self._free.move_to_end(key)
+            while sum(len(figs) for figs in self._free.values()) > self.max_figures:
+                oldest, figs = next(iter(self._free.items()))
+                self._owned.pop(figs.pop(0), None)
+                if not figs:
+                    del self._free[oldest]
+
+    def _discard(self, fig):
+        with self._lock:
+            self._owned.pop(fig, None)
+        fig.clear()
+
+    def _reset(self, fig, axes):
+        # Drop extra axes (colorbars, twins), re-attach grid axes removed by save_plot and undo tight_layout.
+        for ax in list(fig.axes):
+            if not any(ax is grid_ax for grid_ax in axes):
+                fig.delaxes(ax)
+        for ax in axes:
+            if not any(ax is fig_ax for fig_ax in fig.axes):
+                fig.add_axes(ax)
+            ax.clear()
+        fig.legends.clear()
+        fig.texts.clear()
+        fig._suptitle = None
+        fig.subplots_adjust(**{param: rcParams[f'figure.subplot.{param}'] for param in SUBPLOT_PARAMS})
+
+    def clear(self):
+        with self._lock:
+            self._free.clear()
+            self._owned.clear()
+
+    def __getstate__(self):
+        return {'max_figures': self.max_figures}
+
+    def __setstate__(self, state):
+        self.__init__(state['max_figures'])
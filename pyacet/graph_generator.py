@@ -1,41 +1,232 @@
+import sys
+import hashlib
+import multiprocessing
+
 import numpy as np
-import matplotlib.pyplot as plt
+import pandas as pd
+
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib import rcParams
 
 from pyacet.graph_settings import GraphSettings
+from pyacet.instrumentation import instrument, stage
+from pyacet.numeric_profiler import HIST_SUBDIVISIONS, subdivided_histogram
 from pyacet.utils import *
 
+_worker_generator = None
+
+def _init_worker(generator):
+    global _worker_generator
+    _worker_generator = generator
+    generator._apply_style()
+
+def _run_task(name, args, key):
+    return _worker_generator._execute(name, args, key)
+
 
 class GraphGenerator(GraphSettings):
-    def __init__(self, input, output_dir):
-        super().__init__(input, output_dir)
+    def __init__(self, input, output_dir, max_points=100000, scatter_strategy='sample',
+                 kde_strategy='sample', sampling='reservoir', kde_bins=256, random_state=42,
+                 cache_dir=None, cache_max_bytes=256 * 1024 ** 2, figure_pool_size=8, render_profile='default'):
+        super().__init__(input, output_dir, cache_dir, cache_max_bytes, figure_pool_size, render_profile)
         self.input = input
         self.output_dir = output_dir
+        self.max_points = max_points
+        self.scatter_strategy = scatter_strategy
+        self.kde_strategy = kde_strategy
+        self.sampling = sampling
+        self.kde_bins = kde_bins
+        self.random_state = random_state
+        self.plot_strategies = {}
+        self._samples = {}
+        self._tasks = None
+        self._datetime_cubes = {}
+        self._histograms = {}
+        self._column_hashes = {}
+        self._style_token = None
+    
+    def _dispatch(self, render, *args):
+        key = self._plot_key(render.__name__, args) if self.plot_cache is not None else None
+        if self._tasks is None:
+            self._record(self._execute(render.__name__, args, key))
+        else:
+            self._tasks.append((render.__name__, args, key))
+    
+    def _execute(self, name, args, key):
+        if key is None:
+            getattr(self, name)(*args)
+            return None
+        plot_name = self.plot_cache.fetch(key, self.output_dir)
+        if plot_name is not None:
+            print(f"Using Cached Plot : {plot_name}")
+            return 'hit'
+        self._plot_cache_key = key
+        try:
+            getattr(self, name)(*args)
+        finally:
+            self._plot_cache_key = None
+        return 'miss'
+    
+    def _record(self, status):
+        if self.plot_cache is not None:
+            self.plot_cache.record(status)
+    
+    def _plot_key(self, name, args):
+        if self._style_token is None:
+            self._style_token = self._token(sorted((key, str(value)) for key, value in rcParams.items()))
+        settings = (self.max_points, self.scatter_strategy, self.kde_strategy, self.sampling,
+                    self.kde_bins, self.random_state, len(self.input), sorted(self.render_profile.items()))
+        return self.plot_cache.key(name, self._token(args), settings, self._style_token)
+    
+    def _token(self, value):
+        # Column names are expanded with a hash of their data so unchanged columns keep their key.
+        if isinstance(value, str):
+            return f"{value}:{self._column_hash(value)}" if value in self.input.columns else value
+        elif isinstance(value, (pd.DataFrame, pd.Series)):
+            return hashlib.sha1(pd.util.hash_pandas_object(value).to_numpy().tobytes()).hexdigest()
+        elif callable(value):
+            module = getattr(value, '__module__', None) or ''
+            version = getattr(sys.modules.get(module.split('.')[0]), '__version__', '')
+            return f"{module}.{getattr(value, '__qualname__', repr(value))}=={version}"
+        elif isinstance(value, dict):
+            return '{' + ', '.join(f"{key}: {self._token(item)}" for key, item in sorted(value.items())) + '}'
+        elif isinstance(value, (list, tuple, pd.Index, np.ndarray)):
+            return '[' + ', '.join(self._token(item) for item in value) + ']'
+        return repr(value)
+    
+    def _column_hash(self, col):
+        if col not in self._column_hashes:
+            values = pd.util.hash_pandas_object(self.input[col], index=False).to_numpy()
+            self._column_hashes[col] = hashlib.sha1(values.tobytes() + str(self.input[col].dtype).encode()).hexdigest()
+        return self._column_hashes[col]
+    
+    def collect_tasks(self):
+        self._tasks = []
+    
+    @instrument()
+    def run_tasks(self, workers):
+        tasks, self._tasks = self._tasks, None
+        if not tasks:
+            return []
+        # Fork lets workers inherit the frame copy-on-write instead of pickling it.
+        context = multiprocessing.get_context('fork') if sys.platform.startswith('linux') else None
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(self,)) as executor:
+            futures = [executor.submit(_run_task, name, args, key) for name, args, key in tasks]
+            statuses = [future.result() for future in futures]
+        for status in statuses:
+            self._record(status)
+        return statuses
+    
+    def _select_strategy(self, plot_func, main=None):
+        if plot_func.__name__ == 'histplot':
+            # Histograms are drawn from precomputed bin counts, so the row count never reaches seaborn.
+            return 'hist'
+        if self.max_points is None or len(self.input) <= self.max_points:
+            return 'full'
+        if plot_func.__name__ == 'scatterplot':
+            if self.scatter_strategy in ('hexbin', 'hist2d') and pd.api.types.is_numeric_dtype(self.input[main]):
+                return self.scatter_strategy
+            return self.sampling
+        elif plot_func.__name__ == 'kdeplot':
+            return 'hist' if self.kde_strategy == 'hist' else self.sampling
+        elif plot_func.__name__ == 'violinplot':
+            return self.sampling
+        return 'full'
+    
+    def _sample(self, strategy, stratify=None):
+        if strategy != 'stratified' or stratify is None or pd.api.types.is_numeric_dtype(self.input[stratify]):
+            stratify = None
+        if stratify not in self._samples:
+            rng = np.random.default_rng(self.random_state)
+            codes, uniques = pd.factorize(self.input[stratify]) if stratify is not None else (None, [])
+            if stratify is None or len(uniques) >= self.max_points:
+                positions = rng.choice(len(self.input), self.max_points, replace=False)
+            else:
+                frac = self.max_points / len(self.input)
+                positions = []
+                for code in np.unique(codes):
+                    group = np.flatnonzero(codes == code)
+                    positions.append(rng.choice(group, max(1, int(round(len(group) * frac))), replace=False))
+                positions = np.concatenate(positions)
+            self._samples[stratify] = self.input.iloc[np.sort(positions)]
+        return self._samples[stratify]
+    
+    def _binned(self, main):
+        values = self.input[main].dropna().to_numpy(dtype='float64')
+        counts, edges = np.histogram(values[np.isfinite(values)], bins=self.kde_bins)
+        return (edges[:-1] + edges[1:]) / 2, counts
+    
+    def _histogram_range(self, main):
+        return None
+    
+    def _histogram(self, main, bins):
+        key = (main, bins)
+        if key not in self._histograms:
+            values = self.input[main].dropna().to_numpy(dtype='float64')
+            # Every requested bin is split into HIST_SUBDIVISIONS so the KDE overlay has a finer grid to fit.
+            self._histograms[key] = subdivided_histogram(values, bins, self._histogram_range(main))
+        return self._histograms[key]
+    
+    def _plot_binned_hist(self, plot_func, ax, main, args, kwargs):
+        kwargs = kwargs.copy()
+        counts, edges = self._histogram(main, kwargs.pop('bins'))
+        centers = (edges[:-1] + edges[1:]) / 2
+        if kwargs.get('kde'):
+            # Scott's factor for the real row count; the weighted centers alone would give a much wider kernel.
+            kwargs['kde_kws'] = {'bw_method': max(counts.sum(), 1) ** -0.2, **kwargs.get('kde_kws', {})}
+        plot_func(x=centers, weights=counts, bins=edges[::HIST_SUBDIVISIONS].tolist(), ax=ax, *args, **kwargs)
+        ax.set_xlabel(main)
+    
+    def _plot_binned_scatter(self, src, ax, strategy, x, y):
+        data = src[[x, y]].dropna()
+        if strategy == 'hexbin':
+            ax.hexbin(data[x], data[y], gridsize=50, mincnt=1, cmap='viridis')
+        else:
+            ax.hist2d(data[x], data[y], bins=50, cmin=1, cmap='viridis')
+        ax.set_xlabel(x)
+        ax.set_ylabel(y)
     
     def _create_subplots(self, nrows, ncols):
-        fig, axes = plt.subplots(nrows, ncols, figsize=(5*nrows, 5*ncols))
-        if nrows == 1 and ncols == 1:
-            axes = np.array([[axes]])
-        elif nrows == 1 or ncols == 1:
-            axes = np.array([axes]).reshape(nrows, ncols)
-            
-        return fig, axes.flatten()
+        return self.figures.acquire(nrows, ncols, (5*nrows, 5*ncols))
     
     def _generate_single(self, plot_func, plot_name, *args, **kwargs):
-        fig, ax = plt.subplots(figsize=(20, 20))
+        self._dispatch(self._render_single, plot_func, plot_name, args, kwargs)
+    
+    def _render_single(self, plot_func, plot_name, args, kwargs):
+        fig, axes = self.figures.acquire(1, 1, (20, 20))
+        ax = axes[0]
         plot_func(*args, ax=ax, **kwargs)
         ax.set_title(plot_name)
         self.save_plot(fig, [ax], plot_name)
     
     def _generate_sub(self, plot_func, plot_name, *args, **kwargs):
-        src = self.input
         nrows, ncols = self.calculate_ndim(kwargs, 'sub')
+        mains = kwargs.pop('x', None) if 'x' in kwargs else kwargs.pop('y', None)
+        strategy = self._select_strategy(plot_func)
+        if strategy == 'hist' and plot_func.__name__ == 'histplot' and not isinstance(kwargs.get('bins'), (int, np.integer)):
+            strategy = 'full'
+        self.plot_strategies[plot_name] = strategy
+        if strategy == 'hist' and plot_func.__name__ == 'histplot' and self._tasks is not None:
+            # Bin before the workers fork so both histogram families inherit the counts.
+            for main in mains:
+                self._histogram(main, kwargs['bins'])
+        self._dispatch(self._render_sub, plot_func, plot_name, mains, nrows, ncols, strategy, args, kwargs)
+    
+    def _render_sub(self, plot_func, plot_name, mains, nrows, ncols, strategy, args, kwargs):
+        src = self.input if strategy in ('full', 'hist') else self._sample(strategy)
         fig, axes = self._create_subplots(nrows, ncols)
         
-        mains = kwargs.pop('x', None) if 'x' in kwargs else kwargs.pop('y', None)
         for i, main in enumerate(mains):
             if i >= len(axes):
                 break
-            plot_func(data=src[main], ax=axes[i], *args, **kwargs)
+            if strategy == 'hist' and plot_func.__name__ == 'histplot':
+                self._plot_binned_hist(plot_func, axes[i], main, args, kwargs)
+            elif strategy == 'hist':
+                centers, counts = self._binned(main)
+                plot_func(x=centers, weights=counts, ax=axes[i], *args, **kwargs)
+            else:
+                plot_func(data=src[main], ax=axes[i], *args, **kwargs)
         self.save_plot(fig, axes, plot_name, len(mains))
     
     def _generate_multi(self, plot_func, plot_name, *args, **kwargs):
@@ -59,19 +250,30 @@ class GraphGenerator(GraphSettings):
         for main in mains:
             kwargs_clone = kwargs.copy()
             kwargs_clone['x'], kwargs_clone['y'] = main, subs
-            nrows, ncols = self.calculate_ndim(kwargs_clone, 'multi')
-            fig, axes = self._create_subplots(nrows, ncols)
-            
-            for j, sub in enumerate(subs):
-                if j >= len(axes):
-                    break
-                kwargs_clone['y'] = sub
+            strategy = self._select_strategy(plot_func, main)
+            self.plot_strategies[f"{plot_name}_{main}"] = strategy
+            self._dispatch(self._render_numerical, plot_func, plot_name, main, subs, strategy, args, kwargs_clone)
+    
+    def _render_numerical(self, plot_func, plot_name, main, subs, strategy, args, kwargs_clone):
+        src = self.input
+        nrows, ncols = self.calculate_ndim(kwargs_clone, 'multi')
+        fig, axes = self._create_subplots(nrows, ncols)
+        
+        for j, sub in enumerate(subs):
+            if j >= len(axes):
+                break
+            kwargs_clone['y'] = sub
+            if strategy in ('hexbin', 'hist2d') and pd.api.types.is_numeric_dtype(src[sub]):
+                self._plot_binned_scatter(src, axes[j], strategy, main, sub)
+            elif strategy == 'full':
                 plot_func(src, ax=axes[j], *args, **kwargs_clone)
-            
-            self.save_plot(fig, axes, f"{plot_name}_{main}", len(subs))
+            else:
+                plot_func(self._sample(self.sampling, sub), ax=axes[j], *args, **kwargs_clone)
+        
+        self.save_plot(fig, axes, f"{plot_name}_{main}", len(subs))
             
     def _generate_categorical(self, plot_func, plot_name, src, *args, **kwargs):
-        mains, subs = kwargs.get('x'), kwargs.get('y')
+        mains, subs = pd.Index(kwargs.get('x')), kwargs.get('y')
         hues = mains.copy()
         
         for main in mains:
@@ -83,18 +285,20 @@ class GraphGenerator(GraphSettings):
                 pass
             else:
                 kwargs_clone['hue'] = hues.copy()
-                
-                nrows, ncols = self.calculate_ndim(kwargs_clone, 'multi')
-                fig, axes = self._create_subplots(nrows, ncols) 
-                
-                if subs is None:
-                    self._plot_without_subs(plot_func, src, axes, hues, main, kwargs_clone, *args)
-                    self.save_plot(fig, axes, f"{plot_name}_{main}", len(hues))
-                else:
-                    self._plot_with_subs(plot_func, src, axes, subs, hues, main, kwargs_clone, *args)
-                    self.save_plot(fig, axes, f"{plot_name}_{main}", n=len(subs) * len(hues))
-                    
+                self._dispatch(self._render_categorical, plot_func, plot_name, main, subs, hues, args, kwargs_clone)
                 hues = mains.copy()
+    
+    def _render_categorical(self, plot_func, plot_name, main, subs, hues, args, kwargs_clone):
+        src = self.input
+        nrows, ncols = self.calculate_ndim(kwargs_clone, 'multi')
+        fig, axes = self._create_subplots(nrows, ncols) 
+        
+        if subs is None:
+            self._plot_without_subs(plot_func, src, axes, hues, main, kwargs_clone, *args)
+            self.save_plot(fig, axes, f"{plot_name}_{main}", len(hues))
+        else:
+            self._plot_with_subs(plot_func, src, axes, subs, hues, main, kwargs_clone, *args)
+            self.save_plot(fig, axes, f"{plot_name}_{main}", n=len(subs) * len(hues))
                 
     def _plot_without_subs(self, plot_func, src, axes, hues, main, kwargs_clone, *args):
         for k, hue in enumerate(hues):
@@ -120,8 +324,31 @@ class GraphGenerator(GraphSettings):
     
     def _generate_datetime(self, plot_func, plot_name, src, *args, **kwargs):
         mains, subs, mode = kwargs.get('x'), kwargs.get('y'), kwargs.get('mode')
+        
+        if mode not in self._mode_group():
+            raise ValueError(f"Selected mode({mode}) is invalid. Use 'year' or 'quarter' or 'month' or 'day' or 'hour'.")
+        
+        for main in mains:
+            kwargs_clone = kwargs.copy()
+            kwargs_clone['x'], kwargs_clone['y'] = main, subs
+            kwargs_clone.pop('mode', None)
+            cube = self._datetime_cube(main, subs)[mode] if mode != 'all' else None
+            for agg_func in ['mean', 'median']:
+                grouped = cube.xs(agg_func, axis=1, level=1) if cube is not None else None
+                self._dispatch(self._render_datetime, plot_func, plot_name, main, subs, mode, agg_func, grouped, args, kwargs_clone)
+    
+    def _datetime_cube(self, main, subs):
+        key = (main, tuple(subs))
+        if key not in self._datetime_cubes:
+            src = self.input[list(subs)]
+            self._datetime_cubes[key] = {
+                mode: src.groupby(group(self.input[main])).agg(['mean', 'median'])
+                for mode, group in self._mode_group().items() if mode != 'all'
+            }
+        return self._datetime_cubes[key]
     
-        mode_group = {
+    def _mode_group(self):
+        return {
             'year': lambda x: x.dt.year,
             'quarter': lambda x: x.dt.to_period('Q').astype('period[Q]'),
             'month': lambda x: x.dt.to_period('M').astype('period[M]'),
@@ -129,48 +356,40 @@ class GraphGenerator(GraphSettings):
             'hour': lambda x: x.dt.floor('H'),
             'all': lambda x: x
         }
+    
+    def _render_datetime(self, plot_func, plot_name, main, subs, mode, agg_func, grouped, args, kwargs_clone):
+        src = self.input
+        kwargs_clone = kwargs_clone.copy()
+        nrows, ncols = self.calculate_ndim(kwargs_clone, 'multi')
         
-        if mode not in mode_group:
-            raise ValueError(f"Selected mode({mode}) is invalid. Use 'year' or 'quarter' or 'month' or 'day' or 'hour'.")
-        
-        for main in mains:
-            kwargs_clone = kwargs.copy()
-            kwargs_clone['x'], kwargs_clone['y'] = main, subs
-            kwargs_clone.pop('mode', None)
-            nrows, ncols = self.calculate_ndim(kwargs_clone, 'multi')
+        fig, axes = self._create_subplots(nrows, ncols)
+        for j, sub in enumerate(subs):
+            if j >= len(axes):
+                break
             
-            for agg_func in ['mean', 'median']:
-                fig, axes = self._create_subplots(nrows, ncols)
-                for j, sub in enumerate(subs):
-                    if j >= len(axes):
-                        break
-                    
-                    if mode == 'all':
-                        src_group = src[[main, sub]].copy()
-                    else:
-                        group = src.groupby(mode_group[mode](src[main]))
-                        if agg_func == 'mean':
-                            src_group = group[sub].mean().reset_index()
-                        else:
-                            src_group = group[sub].median().reset_index()
-                    src_group[main] = src_group[main].astype(str)
-                    
-                    kwargs_clone['y'] = sub
-                    plot_func(src_group, ax=axes[j], *args, **kwargs_clone)
-                    axes[j].tick_params(axis='x', rotation=45)
-                    
-                    title = f"{sub} by {main}"
-                    if mode is not None:
-                        title += f" (mode: {mode}, agg_func: {agg_func})"
-                    self.set_axis_properties(title, axes[j], sub, main, src=src_group, mode=mode)
-                
-                plot_name_suffix = f"_{mode}" if mode is not None else ""
-                self.save_plot(fig, axes, f"{plot_name}_{main}{plot_name_suffix}_{agg_func}", len(subs))
+            if mode == 'all':
+                src_group = src[[main, sub]].copy()
+            else:
+                src_group = grouped[sub].reset_index()
+            src_group[main] = src_group[main].astype(str)
+            
+            kwargs_clone['y'] = sub
+            plot_func(src_group, ax=axes[j], *args, **kwargs_clone)
+            axes[j].tick_params(axis='x', rotation=45)
+            
+            title = f"{sub} by {main}"
+            if mode is not None:
+                title += f" (mode: {mode}, agg_func: {agg_func})"
+            self.set_axis_properties(title, axes[j], sub, main, src=src_group, mode=mode)
+        
+        plot_name_suffix = f"_{mode}" if mode is not None else ""
+        self.save_plot(fig, axes, f"{plot_name}_{main}{plot_name_suffix}_{agg_func}", len(subs))
     
     def generate_logic(self, plot_func, plot_name, kind, *args, **kwargs):
-        if kind == 'single':
-            self._generate_single(plot_func, plot_name, *args, **kwargs)
-        elif kind == 'sub':
-            self._generate_sub(plot_func, plot_name, *args, **kwargs)
-        elif kind == 'multi':
-            self._generate_multi(plot_func, plot_name, *args, **kwargs)
\ No newline at end of file
+        with stage(f"plot.{kind}.{plot_name}", self.input):
+            if kind == 'single':
+                self._generate_single(plot_func, plot_name, *args, **kwargs)
+            elif kind == 'sub':
+                self._generate_sub(plot_func, plot_name, *args, **kwargs)
+            elif kind == 'multi':
+                self._generate_multi(plot_func, plot_name, *args, **kwargs)
\ No newline at end of file
@@ -1,44 +1,119 @@
 import os
+import threading
 import matplotlib
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+import matplotlib.style
 
 from matplotlib import font_manager, rcParams
-from functools import wraps
+from matplotlib.ticker import MaxNLocator
+from functools import lru_cache, wraps
 
+from pyacet.figure_pool import FigurePool
+from pyacet.plot_cache import PlotCache
 from pyacet.resources import get_font_path
 from pyacet.utils import *
 
+RENDER_PROFILES = {
+    'default': {},
+    'fast': {'dpi': 72, 'compress_level': 1, 'max_pixels': 4000000},
+    'web': {'format': 'webp', 'dpi': 72, 'quality': 80, 'max_pixels': 4000000},
+    'print': {'dpi': 200, 'vector_format': 'pdf', 'vector_max_axes': 4, 'vector_max_points': 10000},
+    'vector': {'vector_format': 'svg', 'vector_max_axes': 4, 'vector_max_points': 10000}
+}
+
+DEFAULT_RENDER_PROFILE = {'format': 'png', 'dpi': None, 'compress_level': None, 'quality': None,
+                          'max_pixels': None, 'vector_format': None, 'vector_max_axes': 0, 'vector_max_points': None}
+
+_font_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def _register_font(font_path):
+    # Parsed and registered once per process; later GraphSettings only look the family name up.
+    with _font_lock:
+        font_manager.fontManager.addfont(font_path)
+        return font_manager.FontProperties(fname=font_path).get_name()
+
 class GraphSettings:
-    def __init__(self, input, output_dir):
+    def __init__(self, input, output_dir, cache_dir=None, cache_max_bytes=256 * 1024 ** 2, figure_pool_size=8,
+                 render_profile='default'):
         self.input = input
+        self.render_profile = self._resolve_render_profile(render_profile)
         self.output_dir = ensure_trailing_slash(output_dir)
         create_output_directory(self.output_dir)
+        self.plot_cache = PlotCache(cache_dir, cache_max_bytes) if cache_dir is not None else None
+        self._plot_cache_key = None
+        self.figures = FigurePool(figure_pool_size)
+        self._apply_style()
+        
+    def _apply_style(self):
         matplotlib.use('Agg')
-        plt.style.use('fast')
+        matplotlib.style.use('fast')
         self._set_font()
         
-    def _clear_plot(self):
-        plt.cla()
-        plt.clf()
-        plt.close()
+    def _clear_plot(self, fig):
+        self.figures.release(fig)
         
     def _set_font(self):
-        font_path = get_font_path('NanumGothic.ttf')
-        font_property = font_manager.FontProperties(fname=font_path)
-        rcParams['font.family'] = font_property.get_name()
+        rcParams['font.family'] = _register_font(get_font_path('NanumGothic.ttf'))
         rcParams['axes.unicode_minus'] = False
         
+    def _resolve_render_profile(self, render_profile):
+        if isinstance(render_profile, str):
+            if render_profile not in RENDER_PROFILES:
+                raise ValueError(f"Selected render profile({render_profile}) is invalid. Use one of {list(RENDER_PROFILES)} or a dict.")
+            render_profile = RENDER_PROFILES[render_profile]
+        unknown = set(render_profile) - set(DEFAULT_RENDER_PROFILE)
+        if unknown:
+            raise ValueError(f"Unknown render profile options: {sorted(unknown)}.")
+        return {**DEFAULT_RENDER_PROFILE, **render_profile}
+        
+    def _save_options(self, size, n_axes, fig_dpi):
+        profile = self.render_profile
+        # Vector output only pays off for plots with few axes and few drawn points.
+        small_data = profile['vector_max_points'] is None or len(self.input) <= profile['vector_max_points']
+        if profile['vector_format'] is not None and n_axes <= profile['vector_max_axes'] and small_data:
+            return profile['vector_format'], {}
+        
+        file_format = profile['format']
+        options = {}
+        dpi = profile['dpi']
+        if profile['max_pixels'] is not None:
+            # Large grids are rendered at a lower DPI so no canvas exceeds the pixel budget.
+            width, height = size
+            current = dpi or (fig_dpi if rcParams['savefig.dpi'] == 'figure' else rcParams['savefig.dpi'])
+            dpi = min(current, (profile['max_pixels'] / (width * height)) ** 0.5)
+        if dpi is not None:
+            options['dpi'] = dpi
+        if file_format == 'png' and profile['compress_level'] is not None:
+            options['pil_kwargs'] = {'compress_level': profile['compress_level']}
+        elif file_format in ('jpeg', 'jpg', 'webp') and profile['quality'] is not None:
+            options['pil_kwargs'] = {'quality': profile['quality']}
+        return file_format, options
+        
     def save_plot(self, fig=None, axes=None, plot_name=str, n=None):
         if axes is not None and n and len(axes) > n:
             for ax in axes[n:]:
                 fig.delaxes(ax)
-        plt.tight_layout()
-        plt.savefig(os.path.join(self.output_dir, f"{plot_name}.png"))
-        self._clear_plot()
+        fig.tight_layout()
+        file_format, options = self._save_options(fig.get_size_inches(), len(fig.axes), fig.dpi)
+        plot_path = os.path.join(self.output_dir, f"{plot_name}.{file_format}")
+        fig.savefig(plot_path, format=file_format, **options)
+        self._clear_plot(fig)
+        self._finish_plot(plot_name, plot_path)
+        
+    def write_plot(self, content, plot_name, file_format):
+        # For plots rendered elsewhere (e.g. shared with the report) as already encoded bytes.
+        plot_path = os.path.join(self.output_dir, f"{plot_name}.{file_format}")
+        with open(plot_path, 'wb') as f:
+            f.write(content)
+        self._finish_plot(plot_name, plot_path)
+        
+    def _finish_plot(self, plot_name, plot_path):
+        if self._plot_cache_key is not None:
+            self.plot_cache.store(self._plot_cache_key, plot_name, plot_path)
         print(f"Generating Plot : {plot_name}")
         
     # def save_plot(func):
@@ -153,4 +228,4 @@ class GraphSettings:
 
     def _set_non_datetime_axis(self, ax, data):
         if len(data) > 20:
-            ax.xaxis.set_major_locator(plt.MaxNLocator(10))
\ No newline at end of file
+            ax.xaxis.set_major_locator(MaxNLocator(10))
\ No newline at end of file
@@ -0,0 +1,88 @@
+import os
+import pickle
+import hashlib
+
+from pyacet.data_loader import DataLoader, ProfiledDataset
+from pyacet.streaming_summary import StreamingSummary
+
+# Bump when the pickled SummaryState layout changes so saved partition states are recomputed.
+STATE_VERSION = 2
+
+class IncrementalSummary(StreamingSummary):
+    def __init__(self, partitions, state_dir, cols=None, chunksize=100000, duplicate_subset=None, duplicate_mode='exact'):
+        self.chunksize = chunksize
+        self.duplicate_subset = duplicate_subset
+        self.duplicate_mode = duplicate_mode
+        self.cols = cols
+        self.state_dir = state_dir
+        self.reused = []
+        self.computed = []
+        os.makedirs(state_dir, exist_ok=True)
+
+        self.state = None
+        for name, partition in self._partitions(partitions):
+            # Later partitions are summarized with the first partition's inferred schema so their states can merge.
+            schema = self.state.schema() if self.state is not None else None
+            state = self._load_or_build(name, partition, schema)
+            if state is None:
+                continue
+            if self.state is None:
+                self.state = state
+            else:
+                self.state.merge(state)
+        if self.state is None:
+            raise ValueError('Input data is empty.')
+        self._set_columns()
+        print(f"Partitions : {len(self.reused)} reused, {len(self.computed)} computed")
+
+    def _partitions(self, partitions):
+        if isinstance(partitions, dict):
+            return list(partitions.items())
+        if isinstance(partitions, (str, os.PathLike)):
+            partitions = os.fspath(partitions)
+            if not os.path.isdir(partitions):
+                return [(os.path.abspath(partitions), partitions)]
+            partitions = [os.path.join(partitions, name) for name in sorted(os.listdir(partitions))
+                          if DataLoader(os.path.join(partitions, name))._file_format() is not None]
+        if not isinstance(partitions, (list, tuple)):
+            raise TypeError('Partitions Must Be a Directory, a List of File Paths or a Dict of Named Inputs.')
+        named = []
+        for partition in partitions:
+            if not isinstance(partition, (str, os.PathLike)):
+                raise TypeError('In-memory partitions must be passed as a dict of {name: input}.')
+            named.append((os.path.abspath(os.fspath(partition)), os.fspath(partition)))
+        return named
+
+    def _signature(self, partition, schema):
+        if isinstance(partition, str):
+            stat = os.stat(partition)
+            content = (stat.st_size, stat.st_mtime_ns)
+        elif isinstance(partition, ProfiledDataset):
+            content = partition.fingerprint()
+        else:
+            content = DataLoader(partition).profile().fingerprint()
+        return (STATE_VERSION, content, repr(self.cols), self.chunksize, repr(self.duplicate_subset), self.duplicate_mode, repr(schema))
+
+    def _state_path(self, name):
+        return os.path.join(self.state_dir, hashlib.sha1(str(name).encode()).hexdigest() + '.pkl')
+
+    def _load_or_build(self, name, partition, schema=None):
+        path = self._state_path(name)
+        signature = self._signature(partition, schema)
+        if os.path.exists(path):
+            try:
+                with open(path, 'rb') as f:
+                    saved = pickle.load(f)
+                if saved['signature'] == signature:
+                    self.reused.append(name)
+                    return saved['state']
+            except (OSError, EOFError, KeyError, AttributeError, ImportError, pickle.UnpicklingError):
+                pass
+
+        state = self._build_state(partition, self.cols, schema)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            pickle.dump({'name': name, 'signature': signature, 'state': state}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        self.computed.append(name)
+        return state
@@ -0,0 +1,153 @@
+import os
+import csv
+import sys
+import json
+import time
+import threading
+
+from contextlib import contextmanager
+from functools import wraps
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+FIELDS = ['stage', 'parent', 'depth', 'wall_time', 'cpu_time', 'peak_rss_mb', 'rss_growth_mb', 'rows', 'cols', 'thread']
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+def _shape(data):
+    shape = getattr(data, 'shape', None)
+    if shape is not None and len(shape) == 2:
+        return int(shape[0]), int(shape[1])
+    return None, None
+
+class StageRecorder:
+    def __init__(self):
+        self.enabled = False
+        self.profiler = None
+        self.profile_dir = None
+        self.records = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self, profiler=None, profile_dir='profiles'):
+        if profiler not in (None, 'cprofile', 'pyinstrument'):
+            raise ValueError(f"Selected profiler({profiler}) is invalid. Use 'cprofile' or 'pyinstrument'.")
+        self.enabled = True
+        self.profiler = profiler
+        self.profile_dir = profile_dir
+
+    def disable(self):
+        self.enabled = False
+        self.profiler = None
+
+    def clear(self):
+        with self._lock:
+            self.records = []
+
+    @contextmanager
+    def stage(self, name, data=None):
+        if not self.enabled:
+            yield {}
+            return
+        stack = self._local.__dict__.setdefault('stack', [])
+        rows, cols = _shape(data)
+        record = {'stage': name, 'parent': stack[-1] if stack else None, 'depth': len(stack),
+                  'rows': rows, 'cols': cols, 'thread': threading.current_thread().name}
+        # Only the main thread's root stage is profiled; Python 3.12+ refuses concurrent cProfile sessions.
+        root = not stack and threading.current_thread() is threading.main_thread()
+        profiler = self._start_profiler() if root else None
+        stack.append(name)
+        peak_before = _peak_rss_mb()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record['wall_time'] = time.perf_counter() - wall
+            record['cpu_time'] = time.process_time() - cpu
+            record['peak_rss_mb'] = _peak_rss_mb()
+            record['rss_growth_mb'] = record['peak_rss_mb'] - peak_before if peak_before is not None else None
+            stack.pop()
+            if profiler is not None:
+                self._stop_profiler(profiler, name)
+            with self._lock:
+                self.records.append(record)
+
+    def bind(self, func):
+        # Pool threads start with an empty stack; carry the submitting thread's stages over to keep the hierarchy.
+        parents = list(self._local.__dict__.get('stack', []))
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            previous = self._local.__dict__.get('stack')
+            self._local.stack = list(parents)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._local.stack = previous if previous is not None else []
+        return wrapper
+
+    def instrument(self, name=None):
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                owner = args[0] if args else None
+                data = getattr(owner, 'input', getattr(getattr(owner, 'summary', None), 'input', None))
+                with self.stage(name or func.__qualname__, data):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _start_profiler(self):
+        # cProfile cannot nest and the inner stages are inside the root profile anyway.
+        if self.profiler == 'cprofile':
+            import cProfile
+            profiler = cProfile.Profile()
+            profiler.enable()
+            return profiler
+        elif self.profiler == 'pyinstrument':
+            from pyinstrument import Profiler
+            profiler = Profiler()
+            profiler.start()
+            return profiler
+        return None
+
+    def _stop_profiler(self, profiler, name):
+        os.makedirs(self.profile_dir, exist_ok=True)
+        path = os.path.join(self.profile_dir, f"{len(self.records):04d}_{name.replace('/', '_')}")
+        if self.profiler == 'cprofile':
+            profiler.disable()
+            profiler.dump_stats(f"{path}.prof")
+        else:
+            profiler.stop()
+            with open(f"{path}.html", 'w', encoding='utf-8') as f:
+                f.write(profiler.output_html())
+
+    def to_json(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.records, f, indent=2)
+
+    def to_csv(self, path):
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(self.records)
+
+    def summary(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.records, columns=FIELDS)
+
+stage_recorder = StageRecorder()
+stage = stage_recorder.stage
+instrument = stage_recorder.instrument
+bind = stage_recorder.bind
@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+
+from pyacet.sketches import RunningMoments, CoMoments, KLLSketch
+
+QUANTILES = [0.25, 0.5, 0.75]
+HIST_SUBDIVISIONS = 16
+
+def subdivided_histogram(values, bins, value_range=None):
+    # Each np.histogram bin is split into HIST_SUBDIVISIONS equal parts; the coarse edges are kept
+    # verbatim, so summing every HIST_SUBDIVISIONS counts gives exactly np.histogram(values, bins).
+    # ±inf cannot be binned; they are left out and the range falls back to the finite values.
+    values = values[np.isfinite(values)]
+    if value_range is not None and not np.isfinite(value_range).all():
+        value_range = None
+    edges = np.histogram_bin_edges(values, bins, range=value_range)
+    steps = np.arange(HIST_SUBDIVISIONS) / HIST_SUBDIVISIONS
+    fine_edges = np.append((edges[:-1, None] + np.diff(edges)[:, None] * steps).ravel(), edges[-1])
+    values = values[(values >= fine_edges[0]) & (values <= fine_edges[-1])]
+    index = np.minimum(np.searchsorted(fine_edges, values, side='right') - 1, len(fine_edges) - 2)
+    return np.bincount(index, minlength=len(fine_edges) - 1), fine_edges
+
+class NumericProfile:
+    def __init__(self, columns, n_rows, moments, comoments, quantiles, histograms, fine_histograms, bins, approximate):
+        self.columns = pd.Index(columns)
+        self.n_rows = n_rows
+        self.count = pd.Series(moments.count.astype('int64'), index=self.columns)
+        self.nulls = n_rows - self.count
+        with np.errstate(invalid='ignore'):
+            self.mean = pd.Series(np.where(moments.count > 0, moments.mean, np.nan), index=self.columns)
+        self.std = pd.Series(moments.std(), index=self.columns)
+        self.min = pd.Series(moments.min, index=self.columns)
+        self.max = pd.Series(moments.max, index=self.columns)
+        self.quantiles = pd.DataFrame(quantiles, index=QUANTILES, columns=self.columns)
+        self.histograms = histograms
+        self.fine_histograms = fine_histograms
+        self.bins = bins
+        self.approximate = approximate
+        self.comoments = comoments
+
+    def describe(self):
+        return pd.DataFrame([self.count.astype('float64'), self.mean, self.std, self.min,
+                             self.quantiles.loc[0.25], self.quantiles.loc[0.5], self.quantiles.loc[0.75], self.max],
+                            index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'])
+
+    def correlation(self):
+        return pd.DataFrame(self.comoments.correlation(), index=self.columns, columns=self.columns)
+
+class NumericProfiler:
+    def __init__(self, quantile_mode='exact', bins=15, block_bytes=8 * 1024 ** 2, quantile_k=200):
+        if quantile_mode not in ('exact', 'kll'):
+            raise ValueError(f"Selected quantile mode({quantile_mode}) is invalid. Use 'exact' or 'kll'.")
+        self.quantile_mode = quantile_mode
+        self.bins = bins
+        self.block_bytes = block_bytes
+        self.quantile_k = quantile_k
+
+    def profile(self, data):
+        columns = list(data.columns)
+        moments = RunningMoments(len(columns))
+        comoments = CoMoments(len(columns))
+        sketches = [KLLSketch(self.quantile_k) for _ in columns] if self.quantile_mode == 'kll' else None
+
+        # One pass over row blocks sized to stay in cache; counts, nulls, moments, min/max and the
+        # pairwise-complete co-moments all read the same float64 block.
+        block_size = max(1024, self.block_bytes // (8 * max(len(columns), 1)))
+        for start in range(0, len(data), block_size):
+            values = data.iloc[start:start + block_size].to_numpy(dtype='float64', na_value=np.nan)
+            mask = ~np.isnan(values)
+            # ±inf makes the affected moments and correlations NaN/inf, as in describe(); no warning needed.
+            with np.errstate(invalid='ignore'):
+                moments.update(values, mask)
+                comoments.update(values, mask)
+            if sketches is not None:
+                for i, sketch in enumerate(sketches):
+                    sketch.update(values[:, i])
+
+        quantiles = np.full((len(QUANTILES), len(columns)), np.nan)
+        histograms, fine_histograms = {}, {}
+        for i, col in enumerate(columns):
+            if moments.count[i] == 0:
+                histograms[col] = (np.zeros(self.bins, dtype='int64'), np.histogram_bin_edges([], self.bins, range=(0, 1)))
+                if sketches is None:
+                    fine_histograms[col] = subdivided_histogram(np.empty(0), self.bins, (0, 1))
+                continue
+            if sketches is None:
+                quantiles[:, i], fine_histograms[col] = self._exact(data.iloc[:, i], (moments.min[i], moments.max[i]))
+                counts, edges = fine_histograms[col]
+                histograms[col] = (counts.reshape(self.bins, HIST_SUBDIVISIONS).sum(axis=1), edges[::HIST_SUBDIVISIONS])
+            else:
+                value_range = (moments.min[i], moments.max[i])
+                if not np.isfinite(value_range).all():
+                    # ±inf stay out of the bins; the sketch's retained items bound the finite range.
+                    items = np.concatenate(sketches[i].levels)
+                    items = items[np.isfinite(items)]
+                    value_range = (items.min(), items.max()) if items.size else (0, 1)
+                edges = np.histogram_bin_edges([], self.bins, range=value_range)
+                with np.errstate(invalid='ignore'):
+                    quantiles[:, i] = sketches[i].quantile(QUANTILES)
+                # Bins are (e_i, e_i+1] here; with a sketch the counts are approximate either way.
+                ranks = sketches[i].rank(np.append(np.nextafter(edges[0], -np.inf), edges[1:]))
+                histograms[col] = (np.rint(np.diff(ranks)).astype('int64'), edges)
+        return NumericProfile(columns, len(data), moments, comoments, quantiles, histograms, fine_histograms,
+                              self.bins, sketches is not None)
+
+    def _exact(self, series, value_range):
+        values = series.to_numpy(dtype='float64', na_value=np.nan)
+        values = values[~np.isnan(values)]
+        # The known range skips a min/max scan; the plots read these subdivided counts instead of binning again.
+        histogram = subdivided_histogram(values, self.bins, value_range)
+        # Linear interpolation between order statistics, as in pandas describe(); partitioning avoids a full sort.
+        position = np.asarray(QUANTILES) * (len(values) - 1)
+        lower = np.floor(position).astype('int64')
+        upper = np.minimum(lower + 1, len(values) - 1)
+        values = np.partition(values, np.unique(np.concatenate([lower, upper])))
+        # numpy interpolates from the upper neighbour past the midpoint, which keeps ±inf neighbours as ±inf.
+        fraction = position - lower
+        with np.errstate(invalid='ignore'):
+            diff = values[upper] - values[lower]
+            quantiles = np.where(fraction >= 0.5, values[upper] - diff * (1 - fraction), values[lower] + diff * fraction)
+        return quantiles, histogram
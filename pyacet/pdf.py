@@ -3,15 +3,15 @@ import numpy as np
 import pandas as pd
 
 from fpdf import FPDF
-from PIL import Image
 
 from pyacet.resources import get_font_path
 
 class PDF(FPDF):
-    def __init__(self, dataset_name):
+    def __init__(self, dataset_name, generate_time=None, page_offset=0):
         super().__init__()
         self.dataset_name = dataset_name
-        self.generate_time = dt.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.generate_time = generate_time or dt.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.page_offset = page_offset
         self.header_font_size = 18
         self.lv1_font_size = 16
         self.lv2_font_size = 14
@@ -24,6 +24,8 @@ class PDF(FPDF):
         self.img_padding = 5
         self.new_x = 'LMARGIN'
         self.new_y = 'NEXT'
+        self._glyph_tables = {}
+        self.elided = []
         self.add_font('NanumGothic', '', get_font_path('NanumGothic.ttf'), uni=True)
         self.add_font('NanumGothic', 'B', get_font_path('NanumGothicBold.ttf'), uni=True)
         self.add_font('NanumGothic', 'I', get_font_path('NanumGothicExtraBold.ttf'), uni=True)
@@ -37,7 +39,7 @@ class PDF(FPDF):
     def footer(self):
         self.set_y(-15)
         self.set_font('NanumGothic', 'I', 8)
-        self.cell(0, 10, f'Page {self.page_no()}', new_x=self.new_x, new_y=self.new_y, align='C')
+        self.cell(0, 10, f'Page {self.page_offset + self.page_no()}', new_x=self.new_x, new_y=self.new_y, align='C')
         self.set_y(-15)
         self.cell(0, 10, f"Generated at {self.generate_time}", new_x=self.new_x, new_y=self.new_y, align='R')
 
@@ -80,16 +82,17 @@ class PDF(FPDF):
         else:
             self.ln(self.content_margin / 10)
         
-    def add_table(self, df, title, level, none_main_title=False, none_title=True):
+    def add_table(self, df, title, level, none_main_title=False, none_title=True, max_rows=None, max_cols=None, policy='head_tail'):
         if df is None:
             print('df is None')
             return
         
         df = self._convert_to_dataframe(df)
+        df, notes = self._truncate_table(df, max_rows, max_cols, policy)
         self.set_font('NanumGothic', '', self.table_font_size)
         tbl_h = self.font_size + 2
 
-        idx_width, col_widths = self._calculate_widths(df)
+        idx_width, col_widths, idx_texts, cell_texts, cell_widths = self._calculate_widths(df)
         max_cols_per_page = self._calculate_max_cols_per_page(idx_width, col_widths)
         
         if not none_main_title:
@@ -97,7 +100,9 @@ class PDF(FPDF):
             
         for sub_col_idx in max_cols_per_page:
             sub_df, sub_col_widths = self._split_dataframe(df, col_widths, len(sub_col_idx))
+            sub_texts, sub_cell_widths = cell_texts[:, :len(sub_col_idx)], cell_widths[:, :len(sub_col_idx)]
             df, col_widths = df.iloc[:, len(sub_col_idx):], col_widths[len(sub_col_idx):]
+            cell_texts, cell_widths = cell_texts[:, len(sub_col_idx):], cell_widths[:, len(sub_col_idx):]
             
             if self.get_y() + (len(sub_df) + 1) * tbl_h > self.h - self.b_margin:
                 self.add_page()
@@ -106,10 +111,14 @@ class PDF(FPDF):
 
             self.set_font('NanumGothic', '', self.table_font_size)
             self._add_table_header(idx_width, sub_df, sub_col_widths, tbl_h)
-            self._add_table_data(idx_width, sub_df, sub_col_widths, tbl_h)
+            self._add_table_data(idx_width, sub_df, sub_col_widths, tbl_h, idx_texts, sub_texts, sub_cell_widths)
 
             self.ln(self.content_margin)
         
+        for note in notes:
+            self.elided.append(f"{title} : {note}")
+            self.chapter_body('', note, level=4, none_title=True)
+        
     def add_image(self, image):
         available_width = self.epw - 2 * self.img_padding
         origin_w, origin_h = self._get_image_dims(image)
@@ -144,19 +153,91 @@ class PDF(FPDF):
             print(f"Dataset isn't appropriate type {type(df)} to convert to table.")
             return None
         
+    def _truncate_table(self, df, max_rows, max_cols, policy):
+        notes = []
+        if max_cols is not None and len(df.columns) > max_cols:
+            notes.append(f"{len(df.columns) - max_cols} of {len(df.columns)} columns elided.")
+            df = df.iloc[:, :max_cols]
+        if max_rows is not None and len(df) > max_rows:
+            n_rows = len(df)
+            if policy == 'bucket' and pd.api.types.is_numeric_dtype(df.index):
+                df = self._bucket_rows(df, max_rows)
+                notes.append(f"{n_rows} rows bucketed into {len(df)} ranges.")
+            elif policy == 'top_n':
+                df = self._top_n_rows(df, max_rows)
+                notes.append(f"{n_rows - max_rows + 1} of {n_rows} rows merged into 'other'.")
+            else:
+                df = self._head_tail_rows(df, max_rows)
+                notes.append(f"{n_rows - max_rows} of {n_rows} rows elided.")
+        return df, notes
+
+    def _head_tail_rows(self, df, max_rows):
+        head, tail = (max_rows + 1) // 2, max_rows // 2
+        ellipsis = pd.DataFrame([['...'] * len(df.columns)], columns=df.columns,
+                                index=[f"... {len(df) - head - tail} more"])
+        return pd.concat([df.iloc[:head], ellipsis, df.iloc[len(df) - tail:]])
+
+    def _top_n_rows(self, df, max_rows):
+        numeric = df.select_dtypes(include=[np.number])
+        order = numeric.fillna(0).sum(axis=1).sort_values(ascending=False, kind='mergesort').index
+        df = df.loc[order]
+        rest = df.iloc[max_rows - 1:]
+        other = pd.DataFrame([[rest[col].sum() if col in numeric.columns else '...' for col in df.columns]],
+                             columns=df.columns, index=['other'])
+        return pd.concat([df.iloc[:max_rows - 1], other])
+
+    def _bucket_rows(self, df, max_rows):
+        index = df.index.to_numpy(dtype='float64')
+        edges = np.linspace(np.nanmin(index), np.nanmax(index), max_rows + 1)
+        buckets = np.clip(np.searchsorted(edges, index, side='right') - 1, 0, max_rows - 1)
+        df = df.select_dtypes(include=[np.number]).groupby(buckets).sum(min_count=1)
+        df.index = [f"{edges[i]:g}-{edges[i + 1]:g}" for i in df.index]
+        return df
+
+    def _glyph_table(self):
+        key = (self.font_family, self.font_style)
+        if key not in self._glyph_tables:
+            cw = self.current_font.cw
+            default = cw.default_factory() if getattr(cw, 'default_factory', None) else 0
+            table = np.full(max(cw) + 1, default, dtype='float64')
+            table[list(cw.keys())] = list(cw.values())
+            table[0] = 0
+            self._glyph_tables[key] = (table, default)
+        return self._glyph_tables[key]
+
+    def _string_widths(self, texts):
+        texts = np.asarray(texts, dtype=str)
+        if (not texts.size or self.font_stretching != 100 or self.char_spacing != 0
+                or self.text_shaping or not hasattr(self.current_font, 'cw')):
+            return np.array([self.get_string_width(text) for text in texts], dtype='float64')
+        codes = texts.reshape(-1, 1).view(np.uint32)
+        table, default = self._glyph_table()
+        widths = np.where(codes < len(table), table[np.minimum(codes, len(table) - 1)], default)
+        widths[codes == 0] = 0
+        return widths.sum(axis=1) * self.font_size_pt * 0.001 / self.k
+
+    def _measure_values(self, values):
+        try:
+            codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        except TypeError:
+            codes, uniques = np.arange(len(values)), list(values)
+        texts = np.array([str(val) for val in uniques] + [''], dtype=object)[:-1]
+        widths = self._string_widths(texts.astype(str)) if len(texts) else np.zeros(0)
+        return texts[codes], widths[codes]
+
     def _calculate_widths(self, df):
+        idx_texts, idx_value_widths = self._measure_values(df.index)
         idx_header_width = self.get_string_width('No')
-        idx_value_width = max(self.get_string_width(str(idx)) for idx in df.index)
-        idx_width = max(idx_value_width, idx_header_width) + self.tbl_padding
+        idx_width = max(idx_value_widths.max(initial=0), idx_header_width) + self.tbl_padding
         
-        col_widths = []
-        for col in df.columns:
-            header_width = self.get_string_width(str(col))
-            value_width = max(self.get_string_width(str(val)) for val in df[col].values)
-            col_width = max(header_width, value_width) + self.tbl_padding
-            col_widths.append(col_width)
+        header_widths = self._string_widths([str(col) for col in df.columns])
+        cell_texts = np.empty((len(df), len(df.columns)), dtype=object)
+        cell_widths = np.zeros((len(df), len(df.columns)))
+        for j, col in enumerate(df.columns):
+            cell_texts[:, j], cell_widths[:, j] = self._measure_values(df.iloc[:, j])
+        col_widths = list(np.maximum(header_widths, cell_widths.max(axis=0, initial=0)) + self.tbl_padding)
         
-        return idx_width, col_widths
+        return idx_width, col_widths, idx_texts, cell_texts, cell_widths
 
     def _calculate_max_cols_per_page(self, idx_width, col_widths):
         available_width = self.epw - idx_width - 2 * self.page_padding
@@ -188,12 +269,12 @@ class PDF(FPDF):
             self.cell(sub_col_widths[j], tbl_h, str(col), border=1, align='C')
         self.ln()
 
-    def _add_table_data(self, idx_width, sub_df, sub_col_widths, tbl_h):
-        for row in sub_df.itertuples(index=True, name=None):
-            self.cell(idx_width, tbl_h, str(row[0]), border=1, align='C')
-            for j, cell in enumerate(row[1:]):
-                cell_text = str(cell)
-                if sub_col_widths[j] < self.get_string_width(cell_text):
+    def _add_table_data(self, idx_width, sub_df, sub_col_widths, tbl_h, idx_texts, sub_texts, sub_cell_widths):
+        for i in range(len(sub_df)):
+            self.cell(idx_width, tbl_h, idx_texts[i], border=1, align='C')
+            for j in range(sub_texts.shape[1]):
+                cell_text = sub_texts[i, j]
+                if sub_col_widths[j] < sub_cell_widths[i, j]:
                     start_x = self.get_x()
                     start_y = self.get_y()
                     self.multi_cell(sub_col_widths[j], tbl_h, cell_text, border=1, align='C')
@@ -209,6 +290,7 @@ class PDF(FPDF):
                 self._add_table_header(idx_width, sub_df, sub_col_widths, tbl_h)
 
     def _get_image_dims(self, image):
+        from PIL import Image
         if isinstance(image, (str, bytes)):
             with Image.open(image) as img:
                 return img.size
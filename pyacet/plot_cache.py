@@ -0,0 +1,94 @@
+import os
+import glob
+import shutil
+import hashlib
+
+# Eviction trims the cache below this fraction of max_bytes so that the next stores do not evict again right away.
+EVICT_RATIO = 0.8
+
+class PlotCache:
+    def __init__(self, cache_dir, max_bytes=256 * 1024 ** 2):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._sizes = None
+        self._total = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, *tokens):
+        digest = hashlib.sha1()
+        for token in tokens:
+            digest.update(str(token).encode())
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def fetch(self, key, output_dir):
+        for path in glob.glob(os.path.join(self.cache_dir, f"{key}-*")):
+            if path.endswith('.tmp'):
+                continue
+            file_name = os.path.basename(path)[len(key) + 1:]
+            try:
+                shutil.copyfile(path, os.path.join(output_dir, file_name))
+                os.utime(path)
+            except FileNotFoundError:
+                return None
+            return os.path.splitext(file_name)[0]
+        return None
+
+    def store(self, key, plot_name, plot_path):
+        path = os.path.join(self.cache_dir, f"{key}-{os.path.basename(plot_path)}")
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        shutil.copyfile(plot_path, temp_path)
+        os.replace(temp_path, path)
+        if self._sizes is None:
+            self._index(self._scan())
+        else:
+            size = os.path.getsize(path)
+            self._total += size - self._sizes.get(path, 0)
+            self._sizes[path] = size
+        if self._total > self.max_bytes:
+            self.evict()
+
+    def _index(self, entries):
+        self._sizes = {path: size for _, size, path in entries}
+        self._total = sum(self._sizes.values())
+
+    def _scan(self):
+        entries = []
+        for path in glob.glob(os.path.join(self.cache_dir, '*-*')):
+            if path.endswith('.tmp'):
+                continue
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self):
+        # Rescanning here also picks up entries written by other processes sharing the cache directory.
+        entries = sorted(self._scan())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICT_RATIO
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        self._index(entries[removed:])
+
+    def record(self, status):
+        if status == 'hit':
+            self.hits += 1
+        elif status == 'miss':
+            self.misses += 1
+
+    def report(self):
+        print(f"Plot Cache : {self.hits} hits, {self.misses} misses")
+        self.hits, self.misses = 0, 0
@@ -1,62 +1,143 @@
-import io
 import os
+import shutil
+import tempfile
+import datetime as dt
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+from concurrent.futures import ThreadPoolExecutor
 
 from pyacet.data_loader import DataLoader
 from pyacet.data_summary import DataSummary
-from pyacet.pdf import PDF
+from pyacet.streaming_summary import StreamingSummary
+from pyacet.incremental_summary import IncrementalSummary
+from pyacet.instrumentation import bind, instrument, stage
 from pyacet.utils import *
 
 class ReportGenerator:
-    def __init__(self, input, cols, output_dir, dataset_name):
-        self.summary = DataSummary(input, cols)
+    def __init__(self, input, cols, output_dir, dataset_name, chunksize=None,
+                 max_table_rows=50, max_table_cols=50, table_policy='top_n', max_features=100,
+                 sketch_categories=False, state_dir=None, duplicate_subset=None, duplicate_mode='exact',
+                 flush_pages=50, quantile_mode='exact', kendall_sample=None):
+        if state_dir is not None:
+            self.summary = IncrementalSummary(input, state_dir, cols, chunksize or 100000, duplicate_subset, duplicate_mode)
+        elif chunksize is not None:
+            self.summary = StreamingSummary(input, cols, chunksize, duplicate_subset, duplicate_mode)
+        else:
+            self.summary = DataSummary(input, cols, sketch_categories, duplicate_subset, duplicate_mode, quantile_mode, kendall_sample)
         self.output_dir = ensure_trailing_slash(output_dir)
         self.dataset_name = dataset_name
+        self.table_limits = {'max_rows': max_table_rows, 'max_cols': max_table_cols, 'policy': table_policy}
+        self.max_features = max_features
+        self.flush_pages = flush_pages
         create_output_directory(self.output_dir)
 
-    def generate_report(self, exclude_cols):
-        pdf = PDF(self.dataset_name)
-        pdf.add_page()
+    @instrument()
+    def generate_report(self, exclude_cols, workers=None):
+        from pyacet.pdf import PDF
 
-        self._add_data_info_section(pdf)
-        self._add_numerical_summary_section(pdf)
-        self._add_categorical_summary_section(pdf, exclude_cols)
-        self._add_datetime_summary_section(pdf)
-        self._add_correlation_matrix_section(pdf)
-
-        pdf.output(os.path.join(self.output_dir, 'report.pdf'))
+        payloads = self._compute_sections(exclude_cols, workers)
+        sections = [
+            self._add_data_info_section,
+            self._add_numerical_summary_section,
+            self._add_categorical_summary_section,
+            self._add_datetime_summary_section,
+            self._add_correlation_matrix_section,
+        ]
+        generate_time = dt.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        output_path = os.path.join(self.output_dir, 'report.pdf')
+        # Every section starts on a new page, so once the current document reaches flush_pages it is
+        # written out and released at the next section boundary; the parts are merged at the end.
+        # A section is never split across parts, so the largest section is held in memory whole; its size
+        # is bounded by max_table_rows, max_table_cols and max_features rather than by flush_pages.
+        self._section_dir = tempfile.mkdtemp(prefix='.sections-', dir=self.output_dir)
+        try:
+            pdf, paths, pages, elided = None, [], 0, []
+            for idx, (add_section, payload) in enumerate(zip(sections, payloads)):
+                if pdf is None:
+                    pdf = PDF(self.dataset_name, generate_time, page_offset=pages)
+                pdf.add_page()
+                add_section(pdf, payload)
+                if pdf.pages_count >= self.flush_pages or idx == len(sections) - 1:
+                    paths.append(os.path.join(self._section_dir, f"part_{len(paths) + 1}.pdf"))
+                    with stage('pdf.output'):
+                        pdf.output(paths[-1])
+                    pages += pdf.pages_count
+                    elided.extend(pdf.elided)
+                    pdf = None
+            if len(paths) == 1:
+                os.replace(paths[0], output_path)
+            else:
+                with stage('pdf.merge'):
+                    self._merge_sections(paths, output_path)
+        finally:
+            shutil.rmtree(self._section_dir, ignore_errors=True)
         print(f'Generating {self.dataset_name} Data Summary Report in {self.output_dir}.')
+        for note in elided:
+            print(f'Elided - {note}')
+
+    @instrument()
+    def _compute_sections(self, exclude_cols, workers=None):
+        tasks = [
+            self.summary.data_info,
+            self.summary.data_numerical_summary,
+            lambda: self.summary.data_categorical_summary(exclude_cols=exclude_cols),
+            self.summary.data_datetime_summary,
+            self._correlation_payload,
+        ]
+        if workers == 1:
+            return [task() for task in tasks]
+        # The summaries do not depend on each other and spend most of their time in pandas/NumPy with the
+        # GIL released, so they run concurrently and the PDF is laid out afterwards in section order.
+        with ThreadPoolExecutor(max_workers=workers or len(tasks)) as executor:
+            futures = [executor.submit(bind(task)) for task in tasks]
+            return [future.result() for future in futures]
 
-    def _add_data_info_section(self, pdf):
-        info, shape, head, nulls, duplicates = self.summary.data_info()
+    def _correlation_payload(self):
+        correlation_heatmap = self.summary.correlation_heatmap()
+        if correlation_heatmap is None:
+            return None
+        return correlation_heatmap, self.summary.data_correlation_pairs()
+
+    def _merge_sections(self, paths, output_path):
+        from pypdf import PdfWriter
+
+        writer = PdfWriter()
+        for path in paths:
+            writer.append(path)
+        with open(output_path, 'wb') as f:
+            writer.write(f)
+        writer.close()
+
+    @instrument()
+    def _add_data_info_section(self, pdf, data_info):
+        info, shape, head, nulls, duplicates = data_info
         pdf.chapter_title('01. Data Information', level=1)
         pdf.chapter_body('1.1. Data Shape', shape, level=2, last=True)
-        pdf.add_table(head, '1.2. Data Head', level=2)
+        pdf.add_table(head, '1.2. Data Head', level=2, **self.table_limits)
         pdf.chapter_body('1.3. Data Information', info, level=2)
         pdf.chapter_body('1.4. Missing Values', nulls.to_dict(), level=2, last=True)
-        pdf.chapter_body('1.5. Duplicated Rows', f"Number of duplicated rows : {duplicates} rows", level=2)
+        if self.summary.duplicate_error:
+            pdf.chapter_body('1.5. Duplicated Rows', f"Number of duplicated rows : ~{duplicates} rows (± {self.summary.duplicate_error} rows, approximate)", level=2)
+        else:
+            pdf.chapter_body('1.5. Duplicated Rows', f"Number of duplicated rows : {duplicates} rows", level=2)
         pdf.chapter_body('', f"Number of data length : {shape[0]} rows", none_title=True, level=4)
         pdf.chapter_body('', f"Ratio of duplicated rows : {round((duplicates / shape[0]) * 100, 2)}%", none_title=True, level=4, last=True)
 
-    def _add_numerical_summary_section(self, pdf):
-        pdf.add_page()
+    @instrument()
+    def _add_numerical_summary_section(self, pdf, numerical_summary):
         pdf.chapter_title('02. Numerical Columns Summary', level=1)
-        numerical_summary = self.summary.data_numerical_summary()
         if numerical_summary is not None:
-            pdf.add_table(numerical_summary, '2.1. Numerical Columns Statistics', level=2)
+            pdf.add_table(numerical_summary, '2.1. Numerical Columns Statistics', level=2, **self.table_limits)
         else:
             pdf.chapter_body('', "Numerical summary isn't exist.", level=4, none_title=True, last=True)
 
-    def _add_categorical_summary_section(self, pdf, exclude_cols):
-        pdf.add_page()
+    @instrument()
+    def _add_categorical_summary_section(self, pdf, categorical_summary):
         pdf.chapter_title('03. Categorical Columns Summary', level=1)
-        categorical_summary = self.summary.data_categorical_summary(exclude_cols=exclude_cols)
         if categorical_summary is not None:
             categorical_summary, features_dict = categorical_summary
-            pdf.add_table(categorical_summary, '3.1. Categorical Columns Statistics', level=2)
+            pdf.add_table(categorical_summary, '3.1. Categorical Columns Statistics', level=2, **self.table_limits)
             pdf.chapter_title('3.2. Features Information', level=2)
             self._add_features_info(pdf, features_dict)
         else:
@@ -66,36 +147,45 @@ class ReportGenerator:
         for key, value in features_dict.items():
             features = value['features']
             num_features = value['num_features']
-            body = f"Number of features : {num_features}\nFeatures :\n" + ", ".join(features)
+            if value.get('approximate'):
+                body = f"Number of features : ~{num_features} (approximate)\nTop features :\n"
+            else:
+                body = f"Number of features : {num_features}\nFeatures :\n"
+            body += ", ".join(map(str, features[:self.max_features]))
+            if self.max_features is not None and len(features) > self.max_features:
+                note = f"{len(features) - self.max_features} of {len(features)} features elided."
+                pdf.elided.append(f"3.2. {key} : {note}")
+                body += f"\n... {note}"
             pdf.chapter_body(key, body, level=3, custom_ln=1)
 
-    def _add_datetime_summary_section(self, pdf):
-        pdf.add_page()
+    @instrument()
+    def _add_datetime_summary_section(self, pdf, datetime_summary):
         pdf.chapter_title('04. Datetime Columns Summary', level=1)
-        datetime_summary = self.summary.data_datetime_summary()
         if datetime_summary is not None:
+            # Year/month/day buckets stay in time order; ranking them by frequency would drop periods silently.
+            time_limits = dict(self.table_limits, policy='head_tail')
             for idx, (key, value) in enumerate(datetime_summary.items()):
                 if key == 'summary':
-                    pdf.add_table(pd.DataFrame(value), f"4.{idx + 1}. Datetime Columns Statistics", level=2, none_title=False)
+                    pdf.add_table(pd.DataFrame(value), f"4.{idx + 1}. Datetime Columns Statistics", level=2, none_title=False, **self.table_limits)
                 else:
-                    pdf.add_table(pd.DataFrame(value), f"4.{idx + 1}. {key}", level=2, none_main_title=True, none_title=False)
+                    pdf.add_table(pd.DataFrame(value).sort_index(), f"4.{idx + 1}. {key}", level=2, none_main_title=True, none_title=False, **time_limits)
         else:
             pdf.chapter_body('', "Datetime summary isn't exist.", level=4, none_title=True, last=True)
 
-    def _add_correlation_matrix_section(self, pdf):
-        pdf.add_page()
+    @instrument()
+    def _add_correlation_matrix_section(self, pdf, correlation):
         pdf.chapter_title('05. Correlation Matrix', level=1)
-        correlation_matrix = self.summary.data_correlation()
-        if correlation_matrix is not None:
-            self._add_correlation_matrix_image(pdf, correlation_matrix)
+        if correlation is not None:
+            correlation_heatmap, correlation_pairs = correlation
+            self._add_correlation_matrix_image(pdf, correlation_heatmap)
+            if correlation_pairs is not None:
+                pdf.add_table(correlation_pairs, '5.1. Most Correlated Pairs', level=2)
         else:
             pdf.chapter_body('', "Correlation matrix isn't exist.", level=4, none_title=True, last=True)
 
-    def _add_correlation_matrix_image(self, pdf, correlation_matrix):
-        fig, ax = plt.subplots(figsize=(15, 15))
-        sns.heatmap(data=correlation_matrix, annot=True, fmt=".2f", cmap='coolwarm', cbar=True)
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png')
-        plt.close(fig)
-        buf.seek(0)
-        pdf.add_image(buf)
\ No newline at end of file
+    def _add_correlation_matrix_image(self, pdf, correlation_heatmap):
+        # The PNG is referenced by path so the section PDF does not hold a second copy of the bytes.
+        path = os.path.join(self._section_dir, 'correlation_heatmap.png')
+        with open(path, 'wb') as f:
+            f.write(correlation_heatmap)
+        pdf.add_image(path)
\ No newline at end of file
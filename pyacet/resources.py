@@ -1,4 +1,10 @@
-import pkg_resources
+from functools import lru_cache
 
+try:
+    from importlib.resources import files
+except ImportError:
+    from importlib_resources import files
+
+@lru_cache(maxsize=None)
 def get_font_path(filename):
-    return pkg_resources.resource_filename(__name__, f'fonts/{filename}')
\ No newline at end of file
+    return str(files(__package__).joinpath('fonts').joinpath(filename))
@@ -0,0 +1,241 @@
+import numpy as np
+import pandas as pd
+
+class RunningMoments:
+    def __init__(self, n_cols):
+        self.count = np.zeros(n_cols)
+        self.mean = np.zeros(n_cols)
+        self.m2 = np.zeros(n_cols)
+        self.min = np.full(n_cols, np.nan)
+        self.max = np.full(n_cols, np.nan)
+
+    def update(self, values, mask=None):
+        values = np.asarray(values, dtype='float64')
+        if values.ndim == 1:
+            values = values.reshape(-1, 1)
+        if not len(values):
+            return
+        mask = ~np.isnan(values) if mask is None else mask
+        count = mask.sum(axis=0).astype('float64')
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, np.where(mask, values, 0.0).sum(axis=0) / count, 0.0)
+            m2 = (np.where(mask, values - mean, 0.0) ** 2).sum(axis=0)
+        # fmin/fmax skip NaN and leave all-NaN columns as NaN.
+        mins = np.fmin.reduce(values, axis=0)
+        maxs = np.fmax.reduce(values, axis=0)
+        self._combine(count, mean, m2, mins, maxs)
+
+    def merge(self, other):
+        self._combine(other.count, other.mean, other.m2, other.min, other.max)
+
+    def _combine(self, count, mean, m2, mins, maxs):
+        # Chan et al. parallel form of Welford's update.
+        total = self.count + count
+        delta = mean - self.mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ratio = np.where(total > 0, count / total, 0.0)
+            self.m2 = self.m2 + m2 + delta ** 2 * self.count * ratio
+        self.mean = self.mean + delta * ratio
+        self.count = total
+        self.min = np.fmin(self.min, mins)
+        self.max = np.fmax(self.max, maxs)
+
+    def variance(self, ddof=1):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > ddof, self.m2 / (self.count - ddof), np.nan)
+
+    def std(self, ddof=1):
+        return np.sqrt(self.variance(ddof))
+
+class CoMoments:
+    def __init__(self, n_cols):
+        self.shift = None
+        self.n = np.zeros((n_cols, n_cols))
+        self.sx = np.zeros((n_cols, n_cols))
+        self.sxx = np.zeros((n_cols, n_cols))
+        self.sxy = np.zeros((n_cols, n_cols))
+
+    def update(self, values, mask=None):
+        values = np.asarray(values, dtype='float64')
+        mask = ~np.isnan(values) if mask is None else mask
+        if self.shift is None:
+            count = mask.sum(axis=0)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                self.shift = np.where(count > 0, np.where(mask, values, 0.0).sum(axis=0) / count, 0.0)
+        centered = np.where(mask, values - self.shift, 0.0)
+        if mask.all():
+            # Without missing values every pair covers every row, so only the cross products need a gram matrix.
+            self.n += len(values)
+            self.sx += centered.sum(axis=0)[:, None]
+            self.sxx += (centered ** 2).sum(axis=0)[:, None]
+            self.sxy += centered.T @ centered
+            return
+        weights = mask.astype('float64')
+        # Pairwise-complete sums: entry [i, j] only covers rows where both i and j are present.
+        self.n += weights.T @ weights
+        self.sx += centered.T @ weights
+        self.sxx += (centered ** 2).T @ weights
+        self.sxy += centered.T @ centered
+
+    def merge(self, other):
+        if other.shift is None:
+            return
+        if self.shift is None:
+            self.shift = other.shift.copy()
+        d = other.shift - self.shift
+        di, dj = d[:, None], d[None, :]
+        sx = other.sx + di * other.n
+        self.sxx += other.sxx + 2 * di * other.sx + di ** 2 * other.n
+        self.sxy += other.sxy + dj * other.sx + di * other.sx.T + di * dj * other.n
+        self.sx += sx
+        self.n += other.n
+
+    def correlation(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = self.n * self.sxy - self.sx * self.sx.T
+            var_i = self.n * self.sxx - self.sx ** 2
+            corr = cov / np.sqrt(var_i * var_i.T)
+        return np.clip(corr, -1, 1)
+
+class KLLSketch:
+    def __init__(self, k=200, seed=42):
+        self.k = k
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        values = np.asarray(values, dtype='float64').ravel()
+        values = values[~np.isnan(values)]
+        if not values.size:
+            return
+        self.n += values.size
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other):
+        self.n += other.n
+        for level, items in enumerate(other.levels):
+            if level >= len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if items.size > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                keep = items[:items.size % 2]
+                pairs = items[items.size % 2:]
+                promoted = pairs[self._rng.integers(2)::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    @property
+    def exact(self):
+        return len(self.levels) == 1
+
+    def _weighted_items(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(level.size, 2.0 ** i) for i, level in enumerate(self.levels)])
+        order = np.argsort(items, kind='mergesort')
+        return items[order], weights[order]
+
+    def quantile(self, q):
+        if self.n == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        if self.exact:
+            return np.quantile(self.levels[0], q)
+        items, weights = self._weighted_items()
+        cum = np.cumsum(weights)
+        idx = np.searchsorted(cum, np.asarray(q) * cum[-1], side='left')
+        return items[np.clip(idx, 0, items.size - 1)]
+
+    def rank(self, values):
+        items, weights = self._weighted_items()
+        cum = np.concatenate([[0.0], np.cumsum(weights)])
+        return cum[np.searchsorted(items, values, side='right')]
+
+class TopK:
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype='float64')
+        self.max_error = 0.0
+        self.exact = True
+
+    def update(self, values):
+        counts = pd.Series(values).value_counts()
+        self.update_counts(counts[counts > 0])
+
+    def update_counts(self, counts):
+        counts = self._truncate_counts(counts.astype('float64'))
+        if not self.counts.empty:
+            counts = pd.concat([self.counts, counts]).groupby(level=0, sort=False).sum()
+        self.counts = self._truncate_counts(counts)
+
+    def merge(self, other):
+        self.update_counts(other.counts)
+        self.max_error += other.max_error
+        self.exact = self.exact and other.exact
+
+    def _truncate_counts(self, counts):
+        if len(counts) > self.capacity:
+            # Misra-Gries style truncation: surviving counts are lower bounds within max_error.
+            ranked = counts.nlargest(self.capacity + 1)
+            self.max_error += ranked.iloc[self.capacity]
+            self.exact = False
+            return ranked.iloc[:self.capacity]
+        return counts
+
+    def most_common(self, n=None):
+        ranked = self.counts.sort_values(ascending=False, kind='mergesort')
+        return ranked if n is None else ranked.iloc[:n]
+
+class HyperLogLog:
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype='uint8')
+
+    def update(self, values):
+        values = np.asarray(values, dtype=object)
+        if values.size:
+            self.update_hashes(pd.util.hash_array(values, categorize=False))
+
+    def update_hashes(self, hashes):
+        hashes = np.asarray(hashes, dtype='uint64')
+        p = self.precision
+        index = (hashes >> np.uint64(64 - p)).astype('int64')
+        # The guard bit caps the rank at 64 - p + 1 when the remaining bits are all zero.
+        rest = (hashes << np.uint64(p)) | np.uint64(1 << (p - 1))
+        rank = (65 - self._bit_length(rest)).astype('uint8')
+        np.maximum.at(self.registers, index, rank)
+
+    def _bit_length(self, values):
+        high = (values >> np.uint64(32)).astype('float64')
+        low = (values & np.uint64(0xFFFFFFFF)).astype('float64')
+        return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+
+    def merge(self, other):
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(2.0 ** -self.registers.astype('float64'))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * np.log(m / zeros)
+        return estimate
+
+    @property
+    def relative_error(self):
+        return 1.04 / np.sqrt(len(self.registers))
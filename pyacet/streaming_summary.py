@@ -0,0 +1,285 @@
+import numpy as np
+import pandas as pd
+
+from pyacet.artifact_cache import render_correlation_heatmap
+from pyacet.correlation import top_correlated_pairs
+from pyacet.data_loader import DataLoader
+from pyacet.duplicates import DuplicateDetector
+from pyacet.instrumentation import instrument
+from pyacet.sketches import RunningMoments, CoMoments, KLLSketch, TopK, HyperLogLog
+
+TOP_FEATURES = 100
+EXACT_DISTINCT = 10000
+
+class SummaryState:
+    def __init__(self, sample, quantile_k=200, topk_capacity=1000, duplicate_subset=None, duplicate_mode='exact', schema=None):
+        if schema is None:
+            dataset = DataLoader(sample).profile()
+            self.columns = list(sample.columns)
+            self.num_cols = dataset.num_cols
+            self.cat_cols = dataset.cat_cols
+            self.dt_cols = dataset.dt_cols
+        else:
+            if set(sample.columns) != set(schema[0]):
+                raise ValueError(f"Partition columns {list(sample.columns)} do not match the summary columns {list(schema[0])}.")
+            self.columns, self.num_cols, self.cat_cols, self.dt_cols = (list(cols) for cols in schema)
+        self.dtypes = sample.reindex(columns=self.columns).dtypes.astype(str).to_dict()
+        self.head = sample.head()
+        self.n_rows = 0
+        self.n_chunks = 0
+        self.non_null = pd.Series(0, index=self.columns, dtype='int64')
+        self.rows = DuplicateDetector(duplicate_subset, duplicate_mode)
+
+        num_cols = self._as_list(self.num_cols)
+        self.moments = RunningMoments(len(num_cols))
+        self.comoments = CoMoments(len(num_cols))
+        self.quantiles = {col: KLLSketch(quantile_k) for col in num_cols}
+        self.categories = {col: TopK(topk_capacity) for col in self._as_list(self.cat_cols)}
+        self.distinct = {col: HyperLogLog() for col in self._as_list(self.cat_cols)}
+        # Exact datetime values are kept only up to EXACT_DISTINCT; past that the HLL sketch gives the count.
+        self.datetimes = {col: {'min': pd.NaT, 'max': pd.NaT,
+                                'unique': np.empty(0, dtype='int64'),
+                                'distinct': HyperLogLog(),
+                                'year': pd.Series(dtype='int64'),
+                                'month': pd.Series(dtype='int64'),
+                                'day': pd.Series(dtype='int64'),
+                                'dayofweek': pd.Series(dtype='int64')}
+                          for col in self._as_list(self.dt_cols)}
+
+    def _as_list(self, cols):
+        return list(cols) if cols is not None else []
+
+    def schema(self):
+        return (list(self.columns), self._as_list(self.num_cols), self._as_list(self.cat_cols), self._as_list(self.dt_cols))
+
+    def _conform(self, chunk):
+        chunk = chunk.reindex(columns=self.columns)
+        for col in self._as_list(self.num_cols):
+            if not pd.api.types.is_numeric_dtype(chunk[col]):
+                chunk[col] = pd.to_numeric(chunk[col], errors='coerce')
+        for col in self._as_list(self.dt_cols):
+            if not pd.api.types.is_datetime64_any_dtype(chunk[col]):
+                chunk[col] = pd.to_datetime(chunk[col], errors='coerce')
+        for col in self._as_list(self.cat_cols):
+            if not (pd.api.types.is_object_dtype(chunk[col]) or isinstance(chunk[col].dtype, pd.CategoricalDtype)):
+                chunk[col] = chunk[col].astype('string').astype(object)
+        return chunk
+
+    def update(self, chunk):
+        if not len(chunk):
+            return
+        chunk = self._conform(chunk)
+        self.n_rows += len(chunk)
+        self.n_chunks += 1
+        self.non_null = self.non_null.add(chunk.notna().sum(), fill_value=0).astype('int64')
+
+        num_cols = self._as_list(self.num_cols)
+        if num_cols:
+            values = chunk[num_cols].to_numpy(dtype='float64', na_value=np.nan)
+            self.moments.update(values)
+            self.comoments.update(values)
+            for i, col in enumerate(num_cols):
+                self.quantiles[col].update(values[:, i])
+
+        for col, topk in self.categories.items():
+            topk.update(chunk[col])
+            self.distinct[col].update(chunk[col].dropna())
+
+        for col, state in self.datetimes.items():
+            series = chunk[col].dropna()
+            if series.empty:
+                continue
+            state['min'] = series.min() if pd.isna(state['min']) else min(state['min'], series.min())
+            state['max'] = series.max() if pd.isna(state['max']) else max(state['max'], series.max())
+            values = series.to_numpy(dtype='int64')
+            state['distinct'].update_hashes(pd.util.hash_array(values))
+            state['unique'] = self._union_distinct(state['unique'], values)
+            for key, values in [('year', series.dt.year), ('month', series.dt.month),
+                                ('day', series.dt.day), ('dayofweek', series.dt.dayofweek)]:
+                state[key] = state[key].add(values.value_counts(), fill_value=0).astype('int64')
+
+        hash_frame = chunk.copy()
+        if num_cols:
+            hash_frame[num_cols] = hash_frame[num_cols].astype('float64')
+        self.rows.update(hash_frame)
+
+    def merge(self, other):
+        if self.schema() != other.schema():
+            raise ValueError(f"Cannot merge summary states with different schemas: {self.schema()} != {other.schema()}")
+        self.n_rows += other.n_rows
+        self.n_chunks += other.n_chunks
+        self.non_null = self.non_null.add(other.non_null, fill_value=0).astype('int64')
+        self.moments.merge(other.moments)
+        self.comoments.merge(other.comoments)
+        for col, sketch in self.quantiles.items():
+            sketch.merge(other.quantiles[col])
+        for col, topk in self.categories.items():
+            topk.merge(other.categories[col])
+            self.distinct[col].merge(other.distinct[col])
+        for col, state in self.datetimes.items():
+            other_state = other.datetimes[col]
+            if pd.isna(other_state['min']):
+                continue
+            state['min'] = other_state['min'] if pd.isna(state['min']) else min(state['min'], other_state['min'])
+            state['max'] = other_state['max'] if pd.isna(state['max']) else max(state['max'], other_state['max'])
+            state['distinct'].merge(other_state['distinct'])
+            state['unique'] = self._union_distinct(state['unique'], other_state['unique'])
+            for key in ['year', 'month', 'day', 'dayofweek']:
+                state[key] = state[key].add(other_state[key], fill_value=0).astype('int64')
+        self.rows.merge(other.rows)
+
+    def _union_distinct(self, unique, values):
+        if unique is None or values is None:
+            return None
+        unique = np.union1d(unique, values)
+        return unique if len(unique) <= EXACT_DISTINCT else None
+
+    def distinct_count(self, col):
+        state = self.datetimes[col]
+        if state['unique'] is not None:
+            return len(state['unique'])
+        return f"~{int(round(state['distinct'].estimate()))}"
+
+    @property
+    def duplicates(self):
+        return self.rows.duplicates
+
+class StreamingSummary:
+    def __init__(self, input, cols=None, chunksize=100000, duplicate_subset=None, duplicate_mode='exact'):
+        self.chunksize = chunksize
+        self.duplicate_subset = duplicate_subset
+        self.duplicate_mode = duplicate_mode
+        self.state = self._build_state(input, cols)
+        if self.state is None:
+            raise ValueError('Input data is empty.')
+        self._set_columns()
+
+    def _build_state(self, input, cols, schema=None):
+        state = None
+        for chunk in DataLoader(input, cols).iter_chunks(self.chunksize):
+            if state is None:
+                state = SummaryState(chunk, duplicate_subset=self.duplicate_subset, duplicate_mode=self.duplicate_mode, schema=schema)
+            state.update(chunk)
+        return state
+
+    def _set_columns(self):
+        self.num_cols = self.state.num_cols
+        self.cat_cols = self.state.cat_cols
+        self.dt_cols = self.state.dt_cols
+
+    def _info_string(self):
+        state = self.state
+        rows = [(str(i), str(col), f"{state.non_null[col]} non-null", state.dtypes[col])
+                for i, col in enumerate(state.columns)]
+        headers = ('#', 'Column', 'Non-Null Count', 'Dtype')
+        widths = [max(len(headers[j]), *(len(row[j]) for row in rows)) for j in range(4)]
+        lines = [
+            "<class 'pandas.core.frame.DataFrame'>",
+            f"RangeIndex: {state.n_rows} entries, 0 to {state.n_rows - 1}",
+            f"Data columns (total {len(state.columns)} columns):",
+            ' ' + '  '.join(h.ljust(w) for h, w in zip(headers, widths)),
+            ' ' + '  '.join('-' * len(h) + ' ' * (w - len(h)) for h, w in zip(headers, widths))
+        ]
+        lines += [' ' + '  '.join(v.ljust(w) for v, w in zip(row, widths)) for row in rows]
+        dtype_counts = pd.Series(state.dtypes).value_counts().sort_index()
+        lines.append('dtypes: ' + ', '.join(f"{dtype}({count})" for dtype, count in dtype_counts.items()))
+        lines.append(f"chunks: {state.n_chunks} (chunksize: {self.chunksize})")
+        return '\n'.join(lines) + '\n'
+
+    @instrument()
+    def data_info(self):
+        state = self.state
+        data_info = self._info_string()
+        data_shape = (state.n_rows, len(state.columns))
+        data_head = state.head
+        data_null = (state.n_rows - state.non_null).astype('int64')
+        data_duplication = state.duplicates
+        self.duplicate_error = state.rows.error_bound
+
+        return data_info, data_shape, data_head, data_null, data_duplication
+
+    @instrument()
+    def data_numerical_summary(self):
+        if self.num_cols is not None and len(self.num_cols) > 0:
+            moments = self.state.moments
+            quantiles = np.array([self.state.quantiles[col].quantile([0.25, 0.5, 0.75]) for col in self.num_cols]).T
+            num_cols_summary = pd.DataFrame(
+                [moments.count, moments.mean, moments.std(), moments.min,
+                 quantiles[0], quantiles[1], quantiles[2], moments.max],
+                index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'],
+                columns=self.num_cols
+            )
+            return round(num_cols_summary, 2)
+        else:
+            pass
+
+    @instrument()
+    def data_categorical_summary(self, exclude_cols=None):
+        if self.cat_cols is not None and len(self.cat_cols) > 0:
+            summary = {}
+            features_dict = {}
+            for col in self.cat_cols:
+                topk = self.state.categories[col]
+                if topk.exact:
+                    ranked = topk.most_common()
+                    unique = len(ranked)
+                else:
+                    # Past the TopK capacity the surviving keys beyond the top are arbitrary; count with HLL.
+                    ranked = topk.most_common(TOP_FEATURES)
+                    unique = int(round(self.state.distinct[col].estimate()))
+                summary[col] = {'count': self.state.non_null[col],
+                                'unique': unique if topk.exact else f"~{unique}",
+                                'top': ranked.index[0] if len(ranked) else np.nan,
+                                'freq': int(ranked.iloc[0]) if len(ranked) else np.nan}
+                if exclude_cols is None or col not in exclude_cols:
+                    features_dict[col] = {'features': ranked.index.tolist(),
+                                          'num_features': unique,
+                                          'approximate': not topk.exact}
+            cat_cols_summary = pd.DataFrame(summary, index=['count', 'unique', 'top', 'freq'], dtype='object')
+            return cat_cols_summary, features_dict
+        else:
+            pass
+
+    @instrument()
+    def data_datetime_summary(self):
+        if self.dt_cols is not None and len(self.dt_cols) > 0:
+            dt_states = self.state.datetimes
+            dt_cols_summary = {
+                'summary': pd.DataFrame({col: [dt_states[col]['min'], dt_states[col]['max'], self.state.distinct_count(col)]
+                                         for col in self.dt_cols},
+                                        index=['min', 'max', 'nunique'])
+            }
+            for col in self.dt_cols:
+                dt_cols_summary[col] = {
+                    key: dt_states[col][key].sort_values(ascending=False, kind='mergesort')
+                    for key in ['year', 'month', 'day', 'dayofweek']
+                }
+            return dt_cols_summary
+        else:
+            pass
+
+    @instrument()
+    def data_correlation(self, methods='pearson'):
+        if methods != 'pearson':
+            raise ValueError(f"Selected method({methods}) is invalid in streaming mode. Use 'pearson'.")
+        if self.num_cols is not None and len(self.num_cols) > 0:
+            corr_matrix = pd.DataFrame(self.state.comoments.correlation(), index=self.num_cols, columns=self.num_cols)
+            return round(corr_matrix, 2)
+        else:
+            pass
+
+    @instrument()
+    def data_correlation_pairs(self, k=10, methods='pearson'):
+        corr_matrix = self.data_correlation(methods)
+        if corr_matrix is not None and len(corr_matrix) > 1:
+            return top_correlated_pairs(corr_matrix, k)
+        else:
+            pass
+
+    @instrument()
+    def correlation_heatmap(self, methods='pearson', file_format='png', options=None):
+        corr_matrix = self.data_correlation(methods)
+        if corr_matrix is not None:
+            return render_correlation_heatmap(corr_matrix, file_format, options)
+        else:
+            pass
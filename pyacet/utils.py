@@ -66,7 +66,40 @@ def generate_testset():
     num_duplicates = int(len(df) * 0.05)
     duplicate_index = np.random.choice(len(df), size=num_duplicates, replace=True)
     duplicate_data = df.sample(n=1).iloc[0].to_dict()
-    for idx in duplicate_index:
-        df.iloc[idx] = duplicate_data
+    for i, col in enumerate(df.columns):
+        df.iloc[duplicate_index, i] = duplicate_data[col]
     
-    return df
\ No newline at end of file
+    return df
+
+def generate_dataset(rows=1000, num_cols=5, cat_cols=3, dt_cols=1, cardinality=10,
+                     null_rate=0.0, dup_rate=0.0, random_state=42):
+    rng = np.random.default_rng(random_state)
+    columns = {}
+    for i in range(num_cols):
+        columns[f'num_{i}'] = rng.normal(loc=rng.uniform(-100, 100), scale=rng.uniform(1, 50), size=rows)
+    for i in range(cat_cols):
+        categories = np.array([f'cat_{i}_{j}' for j in range(cardinality)], dtype=object)
+        columns[f'cat_{i}'] = categories[rng.integers(0, cardinality, size=rows)]
+    start = np.datetime64('2021-01-01T00:00:00', 's').astype('int64')
+    for i in range(dt_cols):
+        seconds = rng.integers(0, 3 * 365 * 24 * 3600, size=rows)
+        columns[f'dt_{i}'] = (start + seconds).astype('datetime64[s]').astype('datetime64[ns]')
+
+    if null_rate > 0:
+        for name, values in columns.items():
+            mask = rng.random(rows) < null_rate
+            if values.dtype.kind == 'M':
+                values[mask] = np.datetime64('NaT')
+            elif values.dtype == object:
+                values[mask] = None
+            else:
+                values[mask] = np.nan
+
+    num_duplicates = int(rows * dup_rate)
+    if num_duplicates > 0:
+        targets = rng.choice(rows, size=num_duplicates, replace=False)
+        sources = rng.integers(0, rows, size=num_duplicates)
+        for values in columns.values():
+            values[targets] = values[sources]
+
+    return pd.DataFrame(columns)
\ No newline at end of file
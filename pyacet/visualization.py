@@ -1,22 +1,62 @@
 import seaborn as sns
 
+from matplotlib import rcParamsDefault
+
+from pyacet.artifact_cache import HEATMAP_SIZE
 from pyacet.data_loader import DataLoader
 from pyacet.data_summary import DataSummary
 from pyacet.graph_generator import GraphGenerator
+from pyacet.instrumentation import instrument
 
 class Visualization(GraphGenerator):
-    def __init__(self, input, cols, output_dir):
-        super().__init__(input, output_dir)
-        self.input = DataLoader(input, cols).load_data()
-        self.num_cols = DataLoader(input, cols).get_numerical_cols()
-        self.cat_cols = DataLoader(input, cols).get_categorical_cols()
-        self.dt_cols = DataLoader(input, cols).get_datetime_cols()
-        self.corr_matrix = DataSummary(input, cols).data_correlation()
+    def __init__(self, input, cols, output_dir, **kwargs):
+        self.dataset = DataLoader(input, cols).profile()
+        super().__init__(self.dataset.data, output_dir, **kwargs)
+        self.input = self.dataset.data
+        self.num_cols = self.dataset.num_cols
+        self.cat_cols = self.dataset.cat_cols
+        self.dt_cols = self.dataset.dt_cols
+        self.summary = DataSummary(self.dataset)
+        self.corr_matrix = self.summary.data_correlation()
         self.output_dir = output_dir
         
+    def _numeric_profile(self):
+        # The same cached profile the summary reads; another quantile mode would profile the data twice.
+        return self.dataset.numeric_profile(self.summary.quantile_mode)
+
+    def _histogram(self, main, bins):
+        profile = self._numeric_profile()
+        if profile is not None and profile.bins == bins and main in profile.fine_histograms:
+            return profile.fine_histograms[main]
+        return super()._histogram(main, bins)
+
+    def _histogram_range(self, main):
+        # The numeric profile already holds min/max, so binning needs no extra scan for the range.
+        profile = self._numeric_profile()
+        if profile is None or main not in profile.columns or not profile.count[main]:
+            return None
+        return profile.min[main], profile.max[main]
+        
+    def _apply_style(self):
+        super()._apply_style()
         sns.set_theme(style='whitegrid', palette='deep')
         
-    def visualize(self, exclude_cols=None):
+    @instrument()
+    def _generate_heatmap(self):
+        if self.corr_matrix is not None:
+            self._dispatch(self._render_heatmap, self.dataset.fingerprint())
+        
+    def _render_heatmap(self, fingerprint):
+        # The fingerprint only keys the plot cache; the bytes come from the render the report also uses.
+        file_format, options = self._save_options(HEATMAP_SIZE, 1, rcParamsDefault['figure.dpi'])
+        content = self.summary.correlation_heatmap('pearson', file_format, options)
+        self.write_plot(content, 'heatmap', file_format)
+        
+    @instrument()
+    def visualize(self, exclude_cols=None, workers=None):
+        if workers is not None and workers > 1:
+            self.collect_tasks()
+        
         if exclude_cols is not None:
             all_exclude_cols = [cols for cols in self.input.columns if cols not in exclude_cols]
             cat_exclude_cols = [cols for cols in self.cat_cols if cols not in exclude_cols]
@@ -27,7 +67,7 @@ class Visualization(GraphGenerator):
             self.generate_logic(sns.kdeplot, 'kde', kind='sub', x=self.num_cols, fill=True)
             self.generate_logic(sns.boxplot, 'box', kind='sub', y=self.num_cols)
             self.generate_logic(sns.violinplot, 'violin', kind='sub', y=self.num_cols)
-            self.generate_logic(sns.heatmap, 'heatmap', kind='single', data=self.corr_matrix, annot=True, fmt=".2f", cmap='coolwarm', cbar=True)
+            self._generate_heatmap()
             self.generate_logic(sns.boxplot, 'box', kind='multi', x=cat_exclude_cols, y=self.num_cols)
             self.generate_logic(sns.violinplot, 'violin', kind='multi', x=cat_exclude_cols, y=self.num_cols)
             self.generate_logic(sns.scatterplot, 'scatter', kind='multi', x=all_exclude_cols, y=self.num_cols)
@@ -35,7 +75,7 @@ class Visualization(GraphGenerator):
             pass
         
         if self.cat_cols is not None:
-            self.generate_logic(sns.barplot, 'bar', kind='multi', x=cat_exclude_cols, y=self.num_cols)
+            self.generate_logic(sns.barplot, 'bar', kind='multi', x=cat_exclude_cols, y=self.num_cols, seed=42)
             self.generate_logic(sns.countplot, 'count', kind='multi', x=cat_exclude_cols)
         else:
             pass
@@ -45,4 +85,10 @@ class Visualization(GraphGenerator):
             for mode in modes:
                 self.generate_logic(sns.lineplot, 'line', kind='multi', x=self.dt_cols, y=self.num_cols, mode=mode)
         else:
-            pass
\ No newline at end of file
+            pass
+        
+        if workers is not None and workers > 1:
+            self.run_tasks(workers)
+        
+        if self.plot_cache is not None:
+            self.plot_cache.report()
\ No newline at end of file
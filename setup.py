@@ -18,4 +18,7 @@ setup(
     package_data = {
         '': ['pyacet/fonts/*.ttf'],
     },
+    entry_points = {
+        'console_scripts': ['pyacet-batch=pyacet.batch:main'],
+    },
 )
\ No newline at end of file
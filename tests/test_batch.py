@@ -0,0 +1,42 @@
+import os
+import json
+
+import pytest
+
+from pyacet.batch import BatchRunner, main
+from test_report_generator import make_frame
+
+def test_main_reports_good_and_failed_jobs(tmp_path):
+    make_frame().to_csv(tmp_path / 'good.csv', index=False)
+    manifest = tmp_path / 'manifest.jsonl'
+    manifest.write_text(json.dumps({'path': str(tmp_path / 'good.csv')}) + '\n' +
+                        json.dumps({'path': str(tmp_path / 'missing.csv')}) + '\n')
+    output_dir = tmp_path / 'out'
+    assert main([str(manifest), '--output-dir', str(output_dir), '--tasks', 'report', '--workers', '2']) == 1
+    
+    with open(output_dir / 'batch_summary.json', encoding='utf-8') as f:
+        batch_summary = json.load(f)
+    results = {result['dataset_name']: result for result in batch_summary['results']}
+    assert results['good']['status'] == 'ok' and results['good']['rows'] == 300
+    assert results['missing']['status'] == 'failed'
+    assert 'FileNotFoundError' in results['missing']['traceback']
+    assert (batch_summary['summary']['jobs'], batch_summary['summary']['succeeded'], batch_summary['summary']['failed']) == (2, 1, 1)
+    assert os.path.exists(output_dir / 'good' / 'report.pdf')
+
+def test_summary_before_run():
+    runner = BatchRunner([], 'unused')
+    assert runner.summary()['jobs'] == 0 and runner.summary()['elapsed'] == 0.0
+
+@pytest.mark.skipif(not hasattr(os, 'mkfifo'), reason='needs a named pipe')
+def test_job_over_timeout_is_terminated(tmp_path):
+    # Reading a pipe nobody writes to blocks until the job is terminated.
+    os.mkfifo(tmp_path / 'slow.csv')
+    manifest = tmp_path / 'manifest.json'
+    manifest.write_text(json.dumps([{'path': str(tmp_path / 'slow.csv')}]))
+    output_dir = tmp_path / 'out'
+    assert main([str(manifest), '--output-dir', str(output_dir), '--tasks', 'report', '--timeout', '0.5']) == 1
+    
+    with open(output_dir / 'batch_summary.json', encoding='utf-8') as f:
+        batch_summary = json.load(f)
+    assert batch_summary['results'][0]['status'] == 'timeout'
+    assert batch_summary['summary']['timed_out'] == 1
@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+
+from pyacet.categorical_profiler import CategoricalProfiler
+
+def test_low_cardinality_matches_describe():
+    rng = np.random.default_rng(17)
+    series = pd.Series(rng.choice(['red', 'green', 'blue', None], 30000, p=[0.5, 0.3, 0.15, 0.05]))
+    result = CategoricalProfiler(chunksize=4000).profile(series)
+    expected = series.describe()
+    assert not result['approximate']
+    assert (result['count'], result['unique'], result['top'], result['freq']) == \
+        (expected['count'], expected['unique'], expected['top'], expected['freq'])
+    assert result['features'] == series.value_counts().index.tolist()
+
+def test_high_cardinality_is_approximate():
+    rng = np.random.default_rng(19)
+    series = pd.Series(np.concatenate([['hot'] * 5000, [f"id{i}" for i in rng.integers(0, 40000, 60000)]]))
+    result = CategoricalProfiler(exact_threshold=1000, top_k=20, chunksize=10000).profile(series.sample(frac=1, random_state=0))
+    assert result['approximate']
+    assert abs(result['unique'] - series.nunique()) <= 0.05 * series.nunique()
+    assert result['top'] == 'hot' and len(result['features']) == 20
+    assert result['count'] == series.count()
+
+def test_empty_series():
+    result = CategoricalProfiler().profile(pd.Series([None, None], dtype=object))
+    assert result['count'] == 0 and result['unique'] == 0 and np.isnan(result['freq'])
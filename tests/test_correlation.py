@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyacet.correlation import CorrelationEngine, top_correlated_pairs
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=2000)
+    df = pd.DataFrame({'a': base,
+                       'b': base * 0.5 + rng.normal(size=2000),
+                       'c': rng.exponential(size=2000),
+                       'd': 1.7e9 + base * 10 + rng.normal(size=2000)})
+    return df
+
+def with_nulls(df):
+    df = df.copy()
+    rng = np.random.default_rng(1)
+    for i, col in enumerate(df.columns):
+        df.loc[rng.random(len(df)) < 0.05 * (i + 1), col] = np.nan
+    return df
+
+@pytest.mark.parametrize('method', ['pearson', 'spearman'])
+def test_matches_pandas_without_nulls(frame, method):
+    expected = frame.corr(method=method)
+    result = CorrelationEngine(frame).compute(method)
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-4)
+
+@pytest.mark.parametrize('method', ['pearson', 'spearman'])
+def test_matches_pandas_with_nulls(frame, method):
+    frame = with_nulls(frame)
+    expected = frame.corr(method=method)
+    result = CorrelationEngine(frame).compute(method)
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-4)
+
+def test_large_offset_keeps_variance(frame):
+    result = CorrelationEngine(frame).compute('pearson')
+    assert result.loc['a', 'd'] == pytest.approx(frame.corr().loc['a', 'd'], abs=1e-4)
+    assert result.loc['a', 'd'] > 0.9
+
+def test_constant_and_empty_columns_are_nan(frame):
+    frame = frame.assign(const=1.0, empty=np.nan)
+    expected = frame.corr()
+    result = CorrelationEngine(frame).compute('pearson')
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-4)
+
+def test_tiled_gram_matches_untiled(frame):
+    frame = with_nulls(frame)
+    tiled = CorrelationEngine(frame, block_size=1, workers=2).compute('pearson')
+    pd.testing.assert_frame_equal(tiled, CorrelationEngine(frame).compute('pearson'))
+
+def test_invalid_method(frame):
+    with pytest.raises(ValueError):
+        CorrelationEngine(frame).compute('cosine')
+
+def test_top_correlated_pairs(frame):
+    corr = frame.corr()
+    pairs = top_correlated_pairs(corr, k=2)
+    values = corr.where(np.triu(np.ones(corr.shape, dtype=bool), k=1)).stack()
+    expected = values.reindex(values.abs().sort_values(ascending=False).index)[:2]
+    assert list(zip(pairs['column_1'], pairs['column_2'])) == list(expected.index)
+    np.testing.assert_allclose(pairs['correlation'], expected.to_numpy())
+
+def scattered_nulls(n_rows=300, n_cols=12, ties=False):
+    rng = np.random.default_rng(2)
+    values = rng.integers(0, 7, (n_rows, n_cols)).astype('float64') if ties else rng.normal(size=(n_rows, n_cols))
+    frame = pd.DataFrame(values).add_prefix('c')
+    return frame.mask(rng.random(frame.shape) < 0.1)
+
+@pytest.mark.parametrize('ties', [False, True])
+def test_spearman_reranks_scattered_null_pairs(ties):
+    frame = scattered_nulls(ties=ties)
+    expected = frame.corr(method='spearman')
+    engine = CorrelationEngine(frame, dtype='float64')
+    engine.RERANK_BYTES = 50000
+    np.testing.assert_allclose(engine.compute('spearman').to_numpy(), expected.to_numpy(), atol=1e-12)
+
+def test_spearman_reranks_null_pattern_groups():
+    rng = np.random.default_rng(3)
+    frame = pd.DataFrame(rng.normal(size=(400, 9))).add_prefix('c')
+    for rows, cols in [(rng.random(400) < 0.2, ['c0', 'c1', 'c2']), (rng.random(400) < 0.3, ['c3', 'c4'])]:
+        frame.loc[rows, cols] = np.nan
+    expected = frame.corr(method='spearman')
+    np.testing.assert_allclose(CorrelationEngine(frame, dtype='float64').compute('spearman').to_numpy(),
+                               expected.to_numpy(), atol=1e-12)
+
+def test_spearman_column_ranks_when_pairwise_is_off():
+    frame = scattered_nulls()
+    expected = frame.rank().corr()
+    result = CorrelationEngine(frame, dtype='float64', spearman_pairwise=False).compute('spearman')
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-12)
+
+def test_kendall_is_exact_unless_sampling_is_requested(capsys):
+    frame = scattered_nulls(n_rows=600, n_cols=3)
+    np.testing.assert_allclose(CorrelationEngine(frame).compute('kendall').to_numpy(), frame.corr(method='kendall').to_numpy())
+    assert capsys.readouterr().out == ''
+    sampled = CorrelationEngine(frame, kendall_sample=200).compute('kendall')
+    assert 'approximate' in capsys.readouterr().out
+    np.testing.assert_allclose(sampled.to_numpy(), frame.corr(method='kendall').to_numpy(), atol=0.2)
+
+def test_data_summary_passes_kendall_sample():
+    from pyacet.data_summary import DataSummary
+
+    frame = scattered_nulls(n_rows=600, n_cols=3)
+    exact = DataSummary(frame).data_correlation('kendall')
+    np.testing.assert_allclose(exact.to_numpy(), round(frame.corr(method='kendall'), 2).to_numpy())
+    sampled = DataSummary(frame, kendall_sample=100).data_correlation('kendall')
+    expected = round(frame.sample(n=100, random_state=42).corr(method='kendall'), 2)
+    np.testing.assert_allclose(sampled.to_numpy(), expected.to_numpy())
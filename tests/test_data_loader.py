@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyacet.data_loader import DataLoader
+from pyacet.streaming_summary import StreamingSummary
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = 500
+    return pd.DataFrame({'x': rng.normal(size=n),
+                         'n': rng.integers(0, 100, n),
+                         'label': rng.choice(['a', 'b', 'c'], n),
+                         'date': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 300, n), unit='D')})
+
+def test_csv_routes_datetime_dtypes_to_parse_dates(frame, tmp_path):
+    path = tmp_path / 'data.csv'
+    frame.to_csv(path, index=False)
+    data = DataLoader(path, dtypes={'date': 'datetime64[ns]', 'n': 'float64'}).load_data()
+    assert data['date'].dtype == 'datetime64[ns]'
+    assert data['n'].dtype == 'float64'
+    pd.testing.assert_series_equal(data['date'], frame['date'])
+
+def test_csv_date_columns_are_parsed(frame, tmp_path):
+    path = tmp_path / 'data.csv'
+    frame.to_csv(path, index=False)
+    dataset = DataLoader(path).profile()
+    assert list(dataset.dt_cols) == ['date']
+    assert list(dataset.cat_cols) == ['label']
+    summary = StreamingSummary(str(path), chunksize=100)
+    assert summary.state.dtypes['date'] == 'datetime64[ns]'
+
+def test_csv_follows_cols_order(frame, tmp_path):
+    path = tmp_path / 'data.csv'
+    frame.to_csv(path, index=False)
+    loader = DataLoader(path, cols=['label', 'x'])
+    assert list(loader.load_data().columns) == ['label', 'x']
+    assert all(list(chunk.columns) == ['label', 'x'] for chunk in loader.iter_chunks(200))
+
+WRITERS = {
+    'csv': lambda df, path: df.to_csv(path, index=False),
+    'tsv': lambda df, path: df.to_csv(path, sep='\t', index=False),
+    'parquet': lambda df, path: df.to_parquet(path, index=False),
+    'feather': lambda df, path: df.to_feather(path),
+    'jsonl': lambda df, path: df.to_json(path, orient='records', lines=True, date_format='iso')
+}
+
+@pytest.mark.parametrize('extension', list(WRITERS))
+def test_file_round_trip(frame, tmp_path, extension):
+    path = tmp_path / f"data.{extension}"
+    WRITERS[extension](frame, path)
+    cols = ['label', 'x', 'date']
+    loader = DataLoader(path, cols=cols, dtypes={'x': 'float32'})
+    expected = frame[cols].astype({'x': 'float32'})
+    pd.testing.assert_frame_equal(loader.load_data(), expected)
+    
+    chunks = list(DataLoader(path, cols=cols, dtypes={'x': 'float32'}).iter_chunks(150))
+    assert [len(chunk) for chunk in chunks] == [150, 150, 150, 50]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
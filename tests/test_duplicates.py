@@ -0,0 +1,62 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyacet.duplicates import DuplicateDetector
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(13)
+    n = 50000
+    return pd.DataFrame({'a': rng.integers(0, 200, n),
+                         'b': rng.choice(['x', 'y', 'z'], n),
+                         'c': rng.integers(0, 100, n)})
+
+def chunks(df, size=7000):
+    return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+
+def test_exact_matches_pandas(frame):
+    detector = DuplicateDetector()
+    for chunk in chunks(frame):
+        detector.update(chunk)
+    assert detector.duplicates == frame.duplicated().sum()
+    assert detector.error_bound == 0 and not detector.approximate
+
+def test_exact_subset_matches_pandas(frame):
+    detector = DuplicateDetector(subset=['a', 'b'])
+    detector.update(frame)
+    assert detector.duplicates == frame.duplicated(subset=['a', 'b']).sum()
+
+@pytest.mark.parametrize('mode', ['exact', 'bloom', 'hll'])
+def test_merged_partitions_match_pandas(frame, mode):
+    merged = None
+    for chunk in chunks(frame):
+        part = DuplicateDetector(mode=mode, capacity=100000)
+        part.update(chunk)
+        part = pickle.loads(pickle.dumps(part))
+        if merged is None:
+            merged = part
+        else:
+            merged.merge(part)
+    expected = frame.duplicated().sum()
+    assert merged.n_rows == len(frame)
+    if mode == 'exact':
+        assert merged.duplicates == expected
+    else:
+        assert merged.approximate
+        assert abs(merged.duplicates - expected) <= max(2 * merged.error_bound, 0.01 * len(frame))
+
+def test_bloom_only_overcounts(frame):
+    detector = DuplicateDetector(mode='bloom', capacity=100000)
+    for chunk in chunks(frame):
+        detector.update(chunk)
+    expected = frame.duplicated().sum()
+    assert expected <= detector.duplicates <= expected + max(detector.error_bound, 1) * 3
+
+def test_invalid_mode_and_mixed_merge():
+    with pytest.raises(ValueError, match='invalid'):
+        DuplicateDetector(mode='sorted')
+    with pytest.raises(ValueError, match='Cannot merge'):
+        DuplicateDetector(mode='exact').merge(DuplicateDetector(mode='hll'))
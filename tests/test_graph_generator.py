@@ -0,0 +1,87 @@
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+import seaborn as sns
+
+from pyacet.graph_generator import GraphGenerator, HIST_SUBDIVISIONS
+from pyacet.visualization import Visualization
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(5)
+    n = 5000
+    df = pd.DataFrame({'x': rng.normal(size=n),
+                       'y': rng.integers(0, 100, n).astype('float64'),
+                       'label': rng.choice(['a', 'b'], n)})
+    df.loc[rng.random(n) < 0.1, 'x'] = np.nan
+    return df
+
+def bar_heights(generator, col, kde=False):
+    fig, ax = plt.subplots()
+    generator._plot_binned_hist(sns.histplot, ax, col, (), {'bins': 15, 'kde': kde})
+    heights = [patch.get_height() for patch in ax.patches]
+    plt.close(fig)
+    return heights
+
+@pytest.mark.parametrize('col', ['x', 'y'])
+def test_coarse_bars_match_np_histogram(frame, tmp_path, col):
+    expected, _ = np.histogram(frame[col].dropna(), 15)
+    assert bar_heights(GraphGenerator(frame, str(tmp_path)), col) == expected.tolist()
+    assert bar_heights(Visualization(frame, None, str(tmp_path)), col, kde=True) == expected.tolist()
+
+def test_subdivided_counts_sum_to_np_histogram(frame, tmp_path):
+    counts, edges = GraphGenerator(frame, str(tmp_path))._histogram('y', 15)
+    expected, expected_edges = np.histogram(frame['y'].dropna(), 15)
+    assert len(counts) == 15 * HIST_SUBDIVISIONS
+    np.testing.assert_array_equal(counts.reshape(15, HIST_SUBDIVISIONS).sum(axis=1), expected)
+    np.testing.assert_array_equal(edges[::HIST_SUBDIVISIONS], expected_edges)
+
+def test_visualization_reads_the_summary_profile(frame, tmp_path, monkeypatch):
+    visualization = Visualization(frame, None, str(tmp_path))
+    profile = visualization.dataset.numeric_profile(visualization.summary.quantile_mode)
+    monkeypatch.setattr(np, 'histogram', lambda *args, **kwargs: pytest.fail('histogram rescanned the column'))
+    assert visualization._histogram('x', 15) is profile.fine_histograms['x']
+    assert list(visualization.dataset._numeric_profiles) == [(visualization.summary.quantile_mode, 15)]
+
+def test_datetime_cube_matches_per_subplot_groupby(tmp_path):
+    rng = np.random.default_rng(6)
+    n = 3000
+    df = pd.DataFrame({'when': pd.Timestamp('2023-01-01') + pd.to_timedelta(rng.integers(0, 2 * 365 * 24, n), unit='H'),
+                       'a': rng.normal(size=n),
+                       'b': rng.integers(0, 50, n).astype('float64')})
+    df.loc[rng.random(n) < 0.1, 'a'] = np.nan
+    generator = GraphGenerator(df, str(tmp_path))
+    cube = generator._datetime_cube('when', ['a', 'b'])
+    for mode, group in generator._mode_group().items():
+        if mode == 'all':
+            continue
+        for agg_func in ['mean', 'median']:
+            grouped = cube[mode].xs(agg_func, axis=1, level=1)
+            for sub in ['a', 'b']:
+                expected = getattr(df.groupby(group(df['when']))[sub], agg_func)()
+                pd.testing.assert_series_equal(grouped[sub], expected, check_names=False)
+    assert generator._datetime_cube('when', ['a', 'b']) is cube
+
+def test_large_data_strategies(frame, tmp_path):
+    generator = GraphGenerator(frame, str(tmp_path), max_points=1000, scatter_strategy='hexbin',
+                               kde_strategy='hist', sampling='stratified')
+    assert generator._select_strategy(sns.scatterplot, 'x') == 'hexbin'
+    assert generator._select_strategy(sns.scatterplot, 'label') == 'stratified'
+    assert generator._select_strategy(sns.kdeplot) == 'hist'
+    assert generator._select_strategy(sns.violinplot) == 'stratified'
+    assert generator._select_strategy(sns.histplot) == 'hist'
+    assert generator._select_strategy(sns.boxplot) == 'full'
+    assert GraphGenerator(frame, str(tmp_path), max_points=None)._select_strategy(sns.scatterplot, 'x') == 'full'
+    
+    sample = generator._sample('stratified', 'label')
+    assert abs(len(sample) - 1000) <= 2
+    np.testing.assert_allclose(sample['label'].value_counts(normalize=True).sort_index(),
+                               frame['label'].value_counts(normalize=True).sort_index(), atol=0.01)
+    
+    generator.generate_logic(sns.kdeplot, 'kde', kind='sub', x=['x', 'y'], fill=True)
+    generator.generate_logic(sns.violinplot, 'violin', kind='sub', y=['x', 'y'])
+    generator.generate_logic(sns.scatterplot, 'scatter', kind='multi', x=['y', 'label'], y=['x'])
+    assert generator.plot_strategies == {'kde': 'hist', 'violin': 'stratified', 'scatter_x': 'hexbin'}
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyacet.incremental_summary import IncrementalSummary
+from pyacet.streaming_summary import StreamingSummary
+
+@pytest.fixture
+def partitions(tmp_path):
+    rng = np.random.default_rng(1)
+    frames = []
+    for i in range(3):
+        n = 4000
+        frames.append(pd.DataFrame({'x': rng.normal(i, 1, n),
+                                    'label': rng.choice(['a', 'b', 'c', 'd'], n),
+                                    'when': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 90, n), unit='D')}))
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    for i, frame in enumerate(frames):
+        frame.to_csv(data_dir / f"part{i}.csv", index=False)
+    return data_dir, pd.concat(frames, ignore_index=True)
+
+def test_merged_state_matches_pandas(partitions, tmp_path):
+    data_dir, frame = partitions
+    summary = IncrementalSummary(str(data_dir), str(tmp_path / 'state'), chunksize=1500)
+    _, shape, _, nulls, duplicates = summary.data_info()
+    assert shape == frame.shape
+    assert duplicates == frame.duplicated().sum()
+    numeric = summary.data_numerical_summary()
+    expected = round(frame[['x']].describe(), 2)
+    pd.testing.assert_frame_equal(numeric.loc[['count', 'mean', 'std', 'min', 'max']],
+                                  expected.loc[['count', 'mean', 'std', 'min', 'max']], atol=0.011)
+    table, _ = summary.data_categorical_summary()
+    assert table.loc['freq', 'label'] == frame['label'].value_counts().iloc[0]
+
+def test_merged_state_matches_single_pass(partitions, tmp_path):
+    data_dir, frame = partitions
+    merged = IncrementalSummary(str(data_dir), str(tmp_path / 'state'), chunksize=1500)
+    single = StreamingSummary(frame, chunksize=1500)
+    pd.testing.assert_frame_equal(merged.data_numerical_summary().loc[['count', 'mean', 'std']],
+                                  single.data_numerical_summary().loc[['count', 'mean', 'std']])
+
+def test_unchanged_partitions_are_reused(partitions, tmp_path):
+    data_dir, _ = partitions
+    IncrementalSummary(str(data_dir), str(tmp_path / 'state'), chunksize=1500)
+    again = IncrementalSummary(str(data_dir), str(tmp_path / 'state'), chunksize=1500)
+    assert len(again.reused) == 3 and not again.computed
+
+@pytest.mark.parametrize('payload', [b'cmissing_module_xyz\nState\n.', b'cpyacet.sketches\nMissingState\n.'])
+def test_unloadable_state_is_recomputed(partitions, tmp_path, payload):
+    data_dir, _ = partitions
+    state_dir = tmp_path / 'state'
+    first = IncrementalSummary(str(data_dir), str(state_dir), chunksize=1500)
+    path = first._state_path(first.computed[0])
+    # Pickles that reference a module or class which no longer exists.
+    with open(path, 'wb') as f:
+        f.write(payload)
+    again = IncrementalSummary(str(data_dir), str(state_dir), chunksize=1500)
+    assert again.computed == [first.computed[0]]
+    assert again.data_info()[1] == first.data_info()[1]
+
+def test_partition_dtype_is_conformed_to_first_schema(tmp_path):
+    first = pd.DataFrame({'x': [1.0, 2.0, 3.0], 'label': ['a', 'b', 'a']})
+    second = pd.DataFrame({'x': [4.0, 5.0], 'label': [np.nan, np.nan]})
+    summary = IncrementalSummary({'first': first, 'second': second}, str(tmp_path / 'state'))
+    assert list(summary.cat_cols) == ['label']
+    table, _ = summary.data_categorical_summary()
+    assert table.loc['count', 'label'] == 3
+    assert summary.data_info()[1] == (5, 2)
+
+def test_partition_with_different_columns_fails_clearly(tmp_path):
+    first = pd.DataFrame({'x': [1.0, 2.0], 'label': ['a', 'b']})
+    second = pd.DataFrame({'x': [3.0, 4.0], 'other': ['c', 'd']})
+    with pytest.raises(ValueError, match='do not match'):
+        IncrementalSummary({'first': first, 'second': second}, str(tmp_path / 'state'))
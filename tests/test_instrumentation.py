@@ -0,0 +1,28 @@
+import os
+
+from pyacet.instrumentation import stage_recorder
+from pyacet.report_generator import ReportGenerator
+from test_report_generator import make_frame
+
+def record_report(tmp_path, profiler=None):
+    stage_recorder.clear()
+    stage_recorder.enable(profiler, str(tmp_path / 'profiles'))
+    try:
+        ReportGenerator(make_frame(), None, str(tmp_path / 'out'), 'test').generate_report(None, workers=4)
+    finally:
+        stage_recorder.disable()
+    return stage_recorder.records
+
+def test_pool_thread_stages_keep_their_parent(tmp_path):
+    records = {record['stage']: record for record in record_report(tmp_path)}
+    sections = records['ReportGenerator._compute_sections']
+    info = records['DataSummary.data_info']
+    assert info['thread'] != sections['thread']
+    assert info['parent'] == 'ReportGenerator._compute_sections'
+    assert info['depth'] == sections['depth'] + 1
+
+def test_only_the_main_thread_root_is_profiled(tmp_path):
+    records = record_report(tmp_path, 'cprofile')
+    roots = [record for record in records if record['parent'] is None]
+    assert {record['thread'] for record in roots} == {'MainThread'}
+    assert len(os.listdir(tmp_path / 'profiles')) == len(roots)
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyacet.numeric_profiler import NumericProfiler, HIST_SUBDIVISIONS
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(7)
+    n = 30000
+    df = pd.DataFrame({'x': rng.normal(10, 3, n),
+                       'y': rng.integers(0, 50, n).astype('float64'),
+                       'z': rng.exponential(2, n),
+                       'empty': np.nan})
+    df.loc[rng.random(n) < 0.2, 'x'] = np.nan
+    return df
+
+def test_exact_profile_matches_pandas(frame):
+    profile = NumericProfiler(block_bytes=1024).profile(frame)
+    pd.testing.assert_frame_equal(profile.describe(), frame.describe(), check_exact=False, rtol=1e-9)
+    pd.testing.assert_frame_equal(profile.correlation(), frame.corr(), check_exact=False, atol=1e-9)
+    pd.testing.assert_series_equal(profile.nulls, frame.isnull().sum(), check_names=False)
+
+def test_histograms_match_np_histogram(frame):
+    profile = NumericProfiler(bins=15).profile(frame)
+    for col in ['x', 'y', 'z']:
+        counts, edges = profile.histograms[col]
+        expected, expected_edges = np.histogram(frame[col].dropna(), 15)
+        np.testing.assert_array_equal(counts, expected)
+        np.testing.assert_array_equal(edges, expected_edges)
+        fine_counts, fine_edges = profile.fine_histograms[col]
+        assert len(fine_counts) == 15 * HIST_SUBDIVISIONS
+        np.testing.assert_array_equal(fine_edges[::HIST_SUBDIVISIONS], expected_edges)
+    assert profile.histograms['empty'][0].sum() == 0
+
+def test_kll_profile_is_close_to_pandas(frame):
+    profile = NumericProfiler('kll').profile(frame)
+    assert profile.approximate
+    expected = frame.describe()
+    pd.testing.assert_frame_equal(profile.describe().loc[['count', 'mean', 'std', 'min', 'max']],
+                                  expected.loc[['count', 'mean', 'std', 'min', 'max']], check_exact=False, rtol=1e-9)
+    for col in ['x', 'z']:
+        spread = expected.loc['75%', col] - expected.loc['25%', col]
+        np.testing.assert_allclose(profile.quantiles[col], expected.loc[['25%', '50%', '75%'], col], atol=0.05 * spread)
+        counts, _ = profile.histograms[col]
+        assert counts.sum() == frame[col].count()
+
+def test_invalid_quantile_mode():
+    with pytest.raises(ValueError, match='quantile mode'):
+        NumericProfiler('median')
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('quantile_mode', ['exact', 'kll'])
+def test_infinite_values_follow_pandas(quantile_mode):
+    frame = pd.DataFrame({'a': [1, 2, np.inf, 4], 'b': [1, 2, 3, 4], 'c': [-np.inf, 1, 2, np.nan]})
+    profile = NumericProfiler(quantile_mode).profile(frame)
+    pd.testing.assert_frame_equal(profile.describe(), frame.describe())
+    for col in frame:
+        finite = frame[col][np.isfinite(frame[col])]
+        counts, edges = profile.histograms[col]
+        expected, expected_edges = np.histogram(finite, 15)
+        np.testing.assert_allclose(edges, expected_edges)
+        if quantile_mode == 'exact':
+            np.testing.assert_array_equal(counts, expected)
+        else:
+            assert counts.sum() == len(finite)
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_summary_and_visualization_accept_infinite_values(tmp_path):
+    from pyacet.data_summary import DataSummary
+    from pyacet.visualization import Visualization
+
+    frame = pd.DataFrame({'a': [1, 2, np.inf, 4] * 10, 'b': np.arange(40.0)})
+    summary = DataSummary(frame)
+    assert summary.data_info()[1] == frame.shape
+    assert summary.data_numerical_summary().loc['max', 'a'] == np.inf
+    assert summary.data_correlation().loc['b', 'b'] == 1
+    counts, _ = Visualization(frame, None, str(tmp_path))._histogram('a', 15)
+    assert counts.sum() == np.isfinite(frame['a']).sum()
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyacet.pdf import PDF
+from pyacet.report_generator import ReportGenerator
+
+@pytest.fixture
+def pdf():
+    pdf = PDF('test')
+    pdf.add_page()
+    pdf.set_font('NanumGothic', '', pdf.table_font_size)
+    return pdf
+
+@pytest.fixture
+def counts():
+    return pd.DataFrame({'count': np.arange(1, 21), 'label': [f"v{i}" for i in range(20)]}, index=range(100, 120))
+
+def test_head_tail_keeps_order_and_marks_elided_rows(pdf, counts):
+    table, notes = pdf._truncate_table(counts, 6, None, 'head_tail')
+    assert list(table.index) == [100, 101, 102, '... 14 more', 117, 118, 119]
+    assert notes == ['14 of 20 rows elided.']
+
+def test_top_n_merges_the_rest_into_other(pdf, counts):
+    table, notes = pdf._truncate_table(counts, 5, None, 'top_n')
+    assert list(table.index) == [119, 118, 117, 116, 'other']
+    assert table.loc['other', 'count'] == counts['count'].iloc[:16].sum()
+    assert table['count'].sum() == counts['count'].sum()
+    assert notes == ["16 of 20 rows merged into 'other'."]
+
+def test_bucket_preserves_totals(pdf, counts):
+    table, notes = pdf._truncate_table(counts, 4, None, 'bucket')
+    assert len(table) == 4
+    assert table['count'].sum() == counts['count'].sum()
+    assert notes == ['20 rows bucketed into 4 ranges.']
+
+def test_columns_are_capped(pdf, counts):
+    table, notes = pdf._truncate_table(counts, None, 1, 'top_n')
+    assert list(table.columns) == ['count']
+    assert notes == ['1 of 2 columns elided.']
+
+def test_string_widths_match_fpdf(pdf):
+    texts = ['', 'abc', '1234.56', '한글 텍스트', 'Mixed 값 123']
+    expected = [pdf.get_string_width(text) for text in texts]
+    np.testing.assert_allclose(pdf._string_widths(texts), expected)
+
+class RecordingPDF:
+    def __init__(self):
+        self.tables = []
+
+    def add_table(self, df, title, level, **kwargs):
+        self.tables.append((title, df, kwargs))
+
+    def chapter_title(self, *args, **kwargs):
+        pass
+
+    def chapter_body(self, *args, **kwargs):
+        pass
+
+def test_datetime_breakdowns_stay_in_time_order(tmp_path):
+    rng = np.random.default_rng(0)
+    dates = pd.Timestamp('1900-01-01') + pd.to_timedelta(rng.integers(0, 365 * 120, 5000), unit='D')
+    report = ReportGenerator(pd.DataFrame({'when': dates, 'value': rng.normal(size=5000)}), None, str(tmp_path), 'test')
+    pdf = RecordingPDF()
+    report._add_datetime_summary_section(pdf, report.summary.data_datetime_summary())
+    title, table, kwargs = pdf.tables[1]
+    assert kwargs['policy'] == 'head_tail'
+    assert table.index.is_monotonic_increasing
+    assert table.loc[1900, 'year'] == (dates.year == 1900).sum()
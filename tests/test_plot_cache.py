@@ -0,0 +1,56 @@
+import os
+
+from pyacet import plot_cache
+from pyacet.plot_cache import PlotCache
+
+def write_plot(directory, name, size):
+    path = os.path.join(directory, name)
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+    return path
+
+def test_store_and_fetch(tmp_path):
+    cache = PlotCache(str(tmp_path / 'cache'))
+    plot_path = write_plot(tmp_path, 'hist.png', 100)
+    key = cache.key('hist', 'x')
+    cache.store(key, 'hist', plot_path)
+    output_dir = tmp_path / 'out'
+    output_dir.mkdir()
+    assert cache.fetch(key, str(output_dir)) == 'hist'
+    assert (output_dir / 'hist.png').read_bytes() == b'x' * 100
+    assert cache.fetch(cache.key('other'), str(output_dir)) is None
+
+def test_running_total_tracks_stores(tmp_path):
+    cache = PlotCache(str(tmp_path / 'cache'), max_bytes=10 ** 6)
+    for i in range(5):
+        cache.store(cache.key(i), 'plot', write_plot(tmp_path, 'plot.png', 100))
+    cache.store(cache.key(0), 'plot', write_plot(tmp_path, 'plot.png', 300))
+    assert cache._total == 4 * 100 + 300
+    assert cache._total == sum(os.path.getsize(os.path.join(cache.cache_dir, name)) for name in os.listdir(cache.cache_dir))
+
+def test_scans_only_when_limit_is_crossed(tmp_path, monkeypatch):
+    cache = PlotCache(str(tmp_path / 'cache'), max_bytes=1000)
+    scans = []
+    scan = cache._scan
+    monkeypatch.setattr(cache, '_scan', lambda: scans.append(1) or scan())
+    for i in range(9):
+        cache.store(cache.key(i), 'plot', write_plot(tmp_path, 'plot.png', 100))
+    assert len(scans) == 1
+    cache.store(cache.key(9), 'plot', write_plot(tmp_path, 'plot.png', 200))
+    assert len(scans) == 2
+
+def test_evicts_oldest_entries_below_the_limit(tmp_path):
+    cache = PlotCache(str(tmp_path / 'cache'), max_bytes=1000)
+    keys = [cache.key(i) for i in range(12)]
+    for i, key in enumerate(keys):
+        cache.store(key, 'plot', write_plot(tmp_path, 'plot.png', 100))
+        stored = os.path.join(cache.cache_dir, f"{key}-plot.png")
+        if os.path.exists(stored):
+            os.utime(stored, (i, i))
+    remaining = sorted(os.listdir(cache.cache_dir))
+    total = sum(os.path.getsize(os.path.join(cache.cache_dir, name)) for name in remaining)
+    assert total <= cache.max_bytes
+    assert cache._total == total
+    assert f"{keys[-1]}-plot.png" in remaining
+    assert f"{keys[0]}-plot.png" not in remaining
+    assert total <= cache.max_bytes * plot_cache.EVICT_RATIO + 100
@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+from pypdf import PdfReader
+
+from pyacet.report_generator import ReportGenerator
+
+def make_frame():
+    rng = np.random.default_rng(3)
+    n = 300
+    return pd.DataFrame({'x': rng.normal(size=n),
+                         'y': rng.normal(size=n),
+                         'label': rng.choice(['a', 'b', 'c'], n),
+                         'when': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 400, n), unit='D')})
+
+def report_pages(tmp_path, name, flush_pages):
+    output_dir = tmp_path / name
+    ReportGenerator(make_frame(), None, str(output_dir), 'test', flush_pages=flush_pages).generate_report(None, workers=1)
+    assert [path.name for path in output_dir.iterdir()] == ['report.pdf']
+    return len(PdfReader(str(output_dir / 'report.pdf')).pages)
+
+def test_flushed_parts_merge_into_the_same_page_count(tmp_path):
+    single = report_pages(tmp_path, 'single', flush_pages=1000)
+    flushed = report_pages(tmp_path, 'flushed', flush_pages=1)
+    assert single >= 5
+    assert flushed == single
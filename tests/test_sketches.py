@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyacet.sketches import RunningMoments, CoMoments, KLLSketch, TopK, HyperLogLog
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(11)
+    n = 20000
+    df = pd.DataFrame({'a': rng.normal(1e6, 5, n),
+                       'b': rng.exponential(3, n),
+                       'c': rng.normal(size=n)})
+    df['c'] += 0.5 * df['b']
+    df.loc[rng.random(n) < 0.15, 'a'] = np.nan
+    df.loc[rng.random(n) < 0.05, 'c'] = np.nan
+    return df
+
+def chunks(df, size=3000):
+    return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+
+def test_running_moments_merge_matches_describe(frame):
+    merged = RunningMoments(frame.shape[1])
+    for chunk in chunks(frame):
+        part = RunningMoments(frame.shape[1])
+        part.update(chunk.to_numpy())
+        merged.merge(part)
+    expected = frame.describe()
+    np.testing.assert_allclose(merged.count, expected.loc['count'])
+    np.testing.assert_allclose(merged.mean, expected.loc['mean'], rtol=1e-12)
+    np.testing.assert_allclose(merged.std(), expected.loc['std'], rtol=1e-9)
+    np.testing.assert_array_equal(merged.min, expected.loc['min'])
+    np.testing.assert_array_equal(merged.max, expected.loc['max'])
+
+def test_comoments_merge_matches_pandas_corr(frame):
+    merged = CoMoments(frame.shape[1])
+    for chunk in chunks(frame):
+        part = CoMoments(frame.shape[1])
+        part.update(chunk.to_numpy())
+        merged.merge(part)
+    np.testing.assert_allclose(merged.correlation(), frame.corr().to_numpy(), atol=1e-9)
+
+def test_comoments_without_nulls_matches_pandas_corr(frame):
+    complete = frame.dropna()
+    sums = CoMoments(complete.shape[1])
+    for chunk in chunks(complete):
+        sums.update(chunk.to_numpy())
+    np.testing.assert_allclose(sums.correlation(), complete.corr().to_numpy(), atol=1e-9)
+
+def test_kll_is_exact_below_capacity():
+    values = np.random.default_rng(0).normal(size=150)
+    sketch = KLLSketch(200)
+    sketch.update(values)
+    assert sketch.exact
+    np.testing.assert_allclose(sketch.quantile([0.25, 0.5, 0.75]), np.quantile(values, [0.25, 0.5, 0.75]))
+
+def test_kll_merge_quantiles_are_close(frame):
+    values = frame['b'].to_numpy()
+    merged = KLLSketch(200)
+    for chunk in np.array_split(values, 7):
+        part = KLLSketch(200)
+        part.update(chunk)
+        merged.merge(part)
+    assert merged.n == len(values)
+    assert not merged.exact
+    q = np.array([0.1, 0.25, 0.5, 0.75, 0.9])
+    # Quantile error is measured in rank: the true rank of each estimate stays within 2% of n.
+    ranks = np.searchsorted(np.sort(values), merged.quantile(q)) / len(values)
+    np.testing.assert_allclose(ranks, q, atol=0.02)
+    np.testing.assert_allclose(merged.rank([np.quantile(values, 0.5)]) / len(values), [0.5], atol=0.02)
+
+def test_kll_empty_and_nan():
+    sketch = KLLSketch()
+    sketch.update([np.nan, np.nan])
+    assert sketch.n == 0
+    assert np.isnan(sketch.quantile(0.5))
+
+def test_topk_exact_below_capacity():
+    values = pd.Series(np.random.default_rng(1).choice(list('abcdefg'), 5000))
+    topk = TopK(capacity=10)
+    for chunk in np.array_split(values, 4):
+        part = TopK(capacity=10)
+        part.update(chunk)
+        topk.merge(part)
+    assert topk.exact and topk.max_error == 0
+    result = topk.most_common()
+    assert result.is_monotonic_decreasing
+    pd.testing.assert_series_equal(result.astype('int64').sort_index(), values.value_counts().sort_index(), check_names=False)
+
+def test_topk_heavy_hitters_past_capacity():
+    rng = np.random.default_rng(2)
+    values = pd.Series(np.concatenate([rng.choice(['x', 'y', 'z'], 6000, p=[0.5, 0.3, 0.2]),
+                                       [f"rare{i}" for i in rng.integers(0, 3000, 6000)]]))
+    values = values.sample(frac=1, random_state=0)
+    topk = TopK(capacity=50)
+    for chunk in np.array_split(values, 6):
+        topk.update(chunk)
+    assert not topk.exact
+    expected = values.value_counts()
+    assert list(topk.most_common(3).index) == list(expected.index[:3])
+    # Surviving counts are lower bounds within max_error of the true counts.
+    for key, count in topk.most_common(3).items():
+        assert expected[key] - topk.max_error <= count <= expected[key]
+
+@pytest.mark.parametrize('distinct', [100, 5000, 200000])
+def test_hll_estimate_within_error(distinct):
+    values = np.arange(distinct).astype(str)
+    hll = HyperLogLog()
+    hll.update(np.concatenate([values, values[:distinct // 2]]))
+    assert abs(hll.estimate() - distinct) <= 4 * hll.relative_error * distinct
+
+def test_hll_merge_matches_single_pass():
+    values = [f"user{i}" for i in range(50000)]
+    single, left, right = HyperLogLog(), HyperLogLog(), HyperLogLog()
+    single.update(values)
+    left.update(values[:30000])
+    right.update(values[20000:])
+    left.merge(right)
+    np.testing.assert_array_equal(left.registers, single.registers)
+    assert left.estimate() == single.estimate()
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyacet.streaming_summary import StreamingSummary, EXACT_DISTINCT
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = 20000
+    df = pd.DataFrame({'x': rng.normal(size=n),
+                       'y': rng.integers(0, 100, n).astype('float64'),
+                       'small': rng.choice(['a', 'b', 'c'], n),
+                       'wide': [f"id{i}" for i in rng.integers(0, 5000, n)],
+                       'when': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 300, n), unit='D')})
+    df.loc[rng.random(n) < 0.1, 'x'] = np.nan
+    df.loc[rng.random(n) < 0.1, 'small'] = None
+    return pd.concat([df, df.iloc[:500]], ignore_index=True)
+
+def test_info_and_duplicates_match_pandas(frame):
+    summary = StreamingSummary(frame, chunksize=3000)
+    _, shape, _, nulls, duplicates = summary.data_info()
+    assert shape == frame.shape
+    pd.testing.assert_series_equal(nulls, frame.isnull().sum(), check_names=False)
+    assert duplicates == frame.duplicated().sum()
+
+def test_numerical_summary_matches_describe(frame):
+    result = StreamingSummary(frame, chunksize=3000).data_numerical_summary()
+    expected = round(frame[['x', 'y']].describe(), 2)
+    rows = ['count', 'mean', 'std', 'min', 'max']
+    pd.testing.assert_frame_equal(result.loc[rows], expected.loc[rows], atol=0.011)
+
+def test_correlation_matches_pandas(frame):
+    result = StreamingSummary(frame, chunksize=3000).data_correlation()
+    np.testing.assert_allclose(result.to_numpy(), round(frame[['x', 'y']].corr(), 2).to_numpy(), atol=0.011)
+
+def test_low_cardinality_categories_are_exact(frame):
+    table, features = StreamingSummary(frame, chunksize=3000).data_categorical_summary()
+    assert table.loc['unique', 'small'] == frame['small'].nunique()
+    assert table.loc['top', 'small'] == frame['small'].value_counts().index[0]
+    assert sorted(features['small']['features']) == sorted(frame['small'].dropna().unique())
+    assert not features['small']['approximate']
+
+def test_high_cardinality_categories_are_estimated(frame):
+    table, features = StreamingSummary(frame, chunksize=3000).data_categorical_summary()
+    expected = frame['wide'].nunique()
+    assert isinstance(table.loc['unique', 'wide'], str) and table.loc['unique', 'wide'].startswith('~')
+    assert features['wide']['approximate']
+    assert features['wide']['num_features'] == pytest.approx(expected, rel=0.05)
+    assert len(features['wide']['features']) <= 100
+
+def test_datetime_summary_matches_pandas(frame):
+    result = StreamingSummary(frame, chunksize=3000).data_datetime_summary()
+    assert result['summary'].loc['min', 'when'] == frame['when'].min()
+    assert result['summary'].loc['max', 'when'] == frame['when'].max()
+    assert result['summary'].loc['nunique', 'when'] == frame['when'].nunique()
+    pd.testing.assert_series_equal(result['when']['month'].sort_index(),
+                                   frame['when'].dt.month.value_counts().sort_index(), check_names=False)
+
+def test_datetime_distinct_count_switches_to_sketch():
+    when = pd.Series(pd.date_range('2000-01-01', periods=EXACT_DISTINCT * 2, freq='H'))
+    result = StreamingSummary(pd.DataFrame({'when': when, 'v': 1.0}), chunksize=5000).data_datetime_summary()
+    nunique = result['summary'].loc['nunique', 'when']
+    assert nunique.startswith('~')
+    assert int(nunique[1:]) == pytest.approx(len(when), rel=0.05)
@@ -0,0 +1,53 @@
+import os
+
+import pytest
+
+from pyacet.utils import generate_dataset
+from pyacet.visualization import Visualization
+
+@pytest.fixture
+def frame():
+    return generate_dataset(2000, 3, 2, 1)
+
+def test_heatmap_uses_render_profile(frame, tmp_path):
+    visualization = Visualization(frame, None, str(tmp_path), render_profile='web')
+    visualization._apply_style()
+    visualization._generate_heatmap()
+    assert os.listdir(tmp_path) == ['heatmap.webp']
+
+def test_heatmap_is_served_from_plot_cache(frame, tmp_path, capsys):
+    cache_dir = str(tmp_path / 'cache')
+    for _ in range(2):
+        visualization = Visualization(frame, None, str(tmp_path / 'out'), cache_dir=cache_dir)
+        visualization._apply_style()
+        visualization._generate_heatmap()
+    assert (visualization.plot_cache.hits, visualization.plot_cache.misses) == (1, 0)
+    assert 'Using Cached Plot : heatmap' in capsys.readouterr().out
+
+def test_heatmap_shares_one_render_with_the_report(frame, tmp_path, monkeypatch):
+    import pyacet.data_summary
+    from pyacet.artifact_cache import artifact_cache, render_correlation_heatmap
+    artifact_cache.clear()
+    calls = []
+    def counting_render(*args):
+        calls.append(args)
+        return render_correlation_heatmap(*args)
+    monkeypatch.setattr(pyacet.data_summary, 'render_correlation_heatmap', counting_render)
+    
+    visualization = Visualization(frame, None, str(tmp_path))
+    visualization._apply_style()
+    visualization._generate_heatmap()
+    report_bytes = pyacet.data_summary.DataSummary(visualization.dataset).correlation_heatmap()
+    assert len(calls) == 1
+    assert (tmp_path / 'heatmap.png').read_bytes() == report_bytes
+
+def test_parallel_visualize_matches_serial(tmp_path):
+    small = generate_dataset(60, 2, 2, 1, cardinality=3)
+    outputs = {}
+    for workers in (None, 2):
+        output_dir = tmp_path / str(workers)
+        visualization = Visualization(small, None, str(output_dir))
+        visualization.visualize([], workers=workers)
+        outputs[workers] = {path.name: path.read_bytes() for path in output_dir.iterdir()}
+    assert len(outputs[None]) > 10
+    assert outputs[2] == outputs[None]